@@ -0,0 +1,226 @@
+"""
+Shared helpers for the generate-c{1,2,3}-markdown.py scripts.
+
+All three levels render observations the same way (grouped by category,
+sorted by severity) and differ only in how much evidence they show, so that
+logic lives here once instead of being copied into every generator.
+"""
+import json
+import os
+from collections import defaultdict
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    # orjson is an optional, much faster drop-in for decoding the input file
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # ijson is optional; with it, very large inputs are parsed incrementally
+    import ijson
+except ImportError:
+    ijson = None
+
+__all__ = [
+    "SEVERITY_ORDER",
+    "SEVERITY_ICONS",
+    "TEMPLATE_VERSION",
+    "STREAM_THRESHOLD_BYTES",
+    "JSON_ERRORS",
+    "json_loads",
+    "stream_items",
+    "content_hash",
+    "is_up_to_date",
+    "report_written",
+    "report_done",
+    "group_by_category",
+    "render_observation",
+    "render_observations",
+]
+
+# Observation ordering (critical > warning > info) and display icons
+SEVERITY_ORDER = {'critical': 0, 'warning': 1, 'info': 2}
+SEVERITY_ICONS = {'critical': '🔴', 'warning': '⚠️', 'info': 'ℹ️'}
+
+# Inputs at least this large are streamed item by item when ijson is available
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Exceptions raised for malformed input, by either the loader or the streamer
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Part of every content hash - bump whenever the rendered markdown changes so
+# files written by an older generator are not mistaken for up to date
+TEMPLATE_VERSION = 1
+
+# How much of an existing output file to read when looking for its hash
+HASH_PROBE_BYTES = 512
+
+
+def stream_items(json_file: str, key: str) -> Optional[Iterator[Dict[str, Any]]]:
+    """
+    Return an iterator over json_file's top-level `key` array, or None.
+
+    None means the caller should load the whole file as usual: ijson is not
+    installed, the file is smaller than STREAM_THRESHOLD_BYTES, or it cannot
+    be stat'ed (the normal path then reports the error).
+    """
+    if ijson is None:
+        return None
+    try:
+        if os.path.getsize(json_file) < STREAM_THRESHOLD_BYTES:
+            return None
+    except OSError:
+        return None
+    return _iter_stream(json_file, f"{key}.item")
+
+
+def _iter_stream(json_file: str, prefix: str) -> Iterator[Dict[str, Any]]:
+    """Yield items under prefix, holding only one of them in memory at a time."""
+    with open(json_file, 'rb') as f:
+        # use_float keeps numbers as float (not Decimal), like json.loads
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def content_hash(item: Dict[str, Any], source_file: str) -> str:
+    """
+    Return a short fingerprint of everything a rendered file depends on.
+
+    Uses the stdlib encoder with sorted keys so the hash is the same whether
+    or not orjson is installed.
+    """
+    payload = json.dumps(
+        [TEMPLATE_VERSION, source_file, item],
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+    )
+    return blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def is_up_to_date(output_file: Path, digest: str) -> bool:
+    """Check whether output_file's frontmatter already carries this hash."""
+    try:
+        with open(output_file, 'rb') as f:
+            head = f.read(HASH_PROBE_BYTES)
+    except FileNotFoundError:
+        return False
+    return f"\nhash: {digest}\n".encode('utf-8') in head
+
+
+def report_written(results: Iterable[Tuple[Path, bool]]) -> Tuple[int, int]:
+    """Print one progress line per output file; returns (written, unchanged) counts."""
+    written_count = unchanged_count = 0
+    for output_file, written in results:
+        if written:
+            written_count += 1
+            print(f"✓ Generated: {output_file}")
+        else:
+            unchanged_count += 1
+            print(f"✓ Unchanged: {output_file}")
+    return written_count, unchanged_count
+
+
+def report_done(written: int, unchanged: int) -> None:
+    """Print the closing summary of a generator run."""
+    print(f"\nDone! Generated {written} markdown file(s), {unchanged} unchanged")
+
+
+def group_by_category(observations: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group observations by category."""
+    grouped: Dict[str, List[Dict]] = defaultdict(list)
+    for obs in observations:
+        grouped[obs.get('category', 'uncategorized')].append(obs)
+    return grouped
+
+
+@lru_cache(maxsize=4096)
+def render_observation(
+    icon: str,
+    description: str,
+    has_evidence: bool,
+    location: Optional[str],
+    snippet: Optional[str],
+    snippet_type: Optional[str],
+    tags: Tuple[str, ...],
+) -> str:
+    """
+    Render one observation bullet.
+
+    Observations are often copied verbatim across systems, so the rendered
+    block is memoized on its field values.
+    """
+    lines = [f"- {icon} **{description}**\n"]
+
+    # Add evidence if present
+    if has_evidence:
+        lines.append(f"  - Evidence: `{location}`\n")
+        if snippet:
+            lines.append(f"  ```{snippet_type}\n")
+            lines.append(f"  {snippet}\n")
+            lines.append("  ```\n")
+
+    # Add tags if present
+    if tags:
+        tag_list = ' '.join(f"`{tag}`" for tag in tags)
+        lines.append(f"  - Tags: {tag_list}\n")
+
+    lines.append("\n")
+    return "".join(lines)
+
+
+def render_observations(
+    observations: Optional[List[Dict[str, Any]]],
+    out: List[str],
+    show_evidence: bool = False,
+    show_snippets: bool = False,
+) -> None:
+    """
+    Append the observations section - always grouped by category.
+
+    show_evidence adds the evidence location of each observation and
+    show_snippets additionally adds its code snippet.
+    """
+    if not observations:
+        out.append("## Observations\n\nNo observations documented.\n")
+        return
+
+    out.append("## Observations\n\n")
+    obs_by_category = group_by_category(observations)
+
+    # Always sort categories alphabetically for consistency
+    for category in sorted(obs_by_category.keys()):
+        out.append(f"### {category.replace('-', ' ').title()}\n\n")
+
+        # Sort by severity: critical > warning > info
+        obs_list = sorted(
+            obs_by_category[category],
+            key=lambda x: SEVERITY_ORDER.get(x.get('severity', 'info'), 3)
+        )
+
+        for obs in obs_list:
+            # Look each optional field up once
+            ev = obs.get('evidence') if show_evidence else None
+            tags = obs.get('tags')
+            location = snippet = snippet_type = None
+            if ev:
+                location = str(ev.get('location', 'N/A'))
+                snippet = ev.get('snippet') if show_snippets else None
+                if snippet:
+                    snippet = str(snippet)
+                    snippet_type = str(ev.get('type', 'text'))
+
+            # Key on the text each field renders as, so the cache never
+            # confuses values that merely compare equal (1, 1.0, True)
+            out.append(render_observation(
+                SEVERITY_ICONS.get(obs.get('severity', 'info'), ''),
+                str(obs.get('description', 'No description')),
+                bool(ev),
+                location,
+                snippet,
+                snippet_type,
+                tuple(map(str, tags)) if tags else (),
+            ))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Generate C1/C2/C3 markdown documentation for several levels in one run.
+
+Runs the same rendering as generate-c{1,2,3}-markdown.py, but pays for
+interpreter start-up, imports and the worker pool only once.
+
+Usage:
+    python generate-c-markdown.py --input c1=c1-systems.json \\
+                                  --input c2=c2-containers.json \\
+                                  --input c3=c3-components.json
+
+Output:
+    Same files as the per-level scripts.
+"""
+import argparse
+import importlib.util
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from _c_common import json_loads, report_done, report_written, stream_items
+
+# Level -> (generator script, top-level JSON key holding the items)
+LEVELS = {
+    'c1': ('generate-c1-markdown.py', 'systems'),
+    'c2': ('generate-c2-markdown.py', 'containers'),
+    'c3': ('generate-c3-markdown.py', 'components'),
+}
+
+# Below this many items (across all levels) a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+
+def load_generator(level: str) -> Any:
+    """Import one of the per-level generator scripts as a module."""
+    script, _ = LEVELS[level]
+    name = f"generate_{level}_markdown"
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).with_name(script))
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so worker processes can unpickle its functions
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Loaded at import time so that spawned workers, which re-import this
+# script, can resolve them as well
+GENERATORS = {level: load_generator(level) for level in LEVELS}
+
+
+def write_markdown(level: str, item: Dict[str, Any], source_file: str, output_file: Path) -> Tuple[Path, bool]:
+    """Render one item with its level's generator (also used by worker processes)."""
+    write = getattr(GENERATORS[level], f"write_{level}_markdown")
+    return write(item, source_file, output_file)
+
+
+def level_input(value: str) -> Tuple[str, str]:
+    """Parse a LEVEL=FILE argument into (level, file)."""
+    level, sep, json_file = value.partition('=')
+    if not sep or not json_file:
+        raise argparse.ArgumentTypeError(f"expected LEVEL=FILE, got {value!r}")
+    if level not in LEVELS:
+        raise argparse.ArgumentTypeError(f"unknown level {level!r} (choose from {', '.join(sorted(LEVELS))})")
+    return level, json_file
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate C1/C2/C3 markdown in a single process.")
+    parser.add_argument('--input', action='append', type=level_input, required=True, metavar='LEVEL=FILE',
+                        help="JSON file and the level it holds, e.g. c1=c1-systems.json (repeatable)")
+    args = parser.parse_args()
+
+    # Output directories already created during this run
+    ensured_dirs: Set[Path] = set()
+    levels: List[str] = []
+    pending: List[Dict[str, Any]] = []
+    sources: List[str] = []
+    output_files: List[Path] = []
+    # Files written and left unchanged by streamed levels
+    streamed_written = streamed_unchanged = 0
+
+    for level, json_file in args.input:
+        generator = GENERATORS[level]
+        _, key = LEVELS[level]
+
+        # Very large inputs are parsed incrementally when ijson is installed
+        streamed = stream_items(json_file, key)
+        if streamed is not None:
+            written, unchanged = generator.generate_streamed(streamed, json_file)
+            streamed_written += written
+            streamed_unchanged += unchanged
+            continue
+
+        # Load JSON
+        try:
+            with open(json_file, 'rb') as f:
+                data = json_loads(f.read())
+        except FileNotFoundError:
+            print(f"Error: File not found: {json_file}")
+            sys.exit(2)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in {json_file}: {e}")
+            sys.exit(2)
+
+        items = data.get(key, [])
+        if not items:
+            print(f"Warning: No {key} found in {json_file}")
+            continue
+
+        print(f"Generating {level} markdown for {len(items)} {key[:-1]}(s)...")
+
+        for item in items:
+            output_file = generator.output_file_for(item, ensured_dirs)
+            if output_file is not None:
+                levels.append(level)
+                pending.append(item)
+                sources.append(json_file)
+                output_files.append(output_file)
+
+    # All levels share one pool, so its start-up is paid at most once
+    if len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            written, unchanged = report_written(executor.map(write_markdown, levels, pending, sources, output_files, chunksize=8))
+    else:
+        written, unchanged = report_written(map(write_markdown, levels, pending, sources, output_files))
+
+    report_done(written + streamed_written, unchanged + streamed_unchanged)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,108 +13,91 @@ Output:
 """
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
-
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+
+from _c_common import (
+    JSON_ERRORS,
+    content_hash,
+    is_up_to_date,
+    json_loads,
+    render_observations,
+    report_done,
+    report_written,
+    stream_items,
+)
+
+# Every generated file lives under this directory
+KB_SYSTEMS = Path("knowledge-base/systems")
+
+# Below this many systems a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Fixed section templates, filled in with str.format_map
+FRONTMATTER_TEMPLATE = """---
+id: {id}
+title: {name}
+level: c1
+type: {type}
+generated: auto
+hash: {hash}
+---
+"""
+METADATA_TEMPLATE = """## Metadata
 
-def group_by_category(observations: List[Dict]) -> Dict[str, List[Dict]]:
-    """Group observations by category."""
-    grouped = {}
-    for obs in observations:
-        category = obs.get('category', 'uncategorized')
-        if category not in grouped:
-            grouped[category] = []
-        grouped[category].append(obs)
-    return grouped
+**Source**: {source_file}
+**Level**: C1 (System Context)
+**ID**: `{id}`
+"""
 
 
-def generate_frontmatter(system: Dict[str, Any]) -> str:
+def generate_frontmatter(system: Dict[str, Any], digest: str, out: List[str]) -> None:
     """Generate YAML frontmatter - always same structure."""
-    return f"""---
-id: {system['id']}
-title: {system['name']}
-level: c1
-type: {system.get('type', 'system')}
-generated: auto
----"""
+    out.append(FRONTMATTER_TEMPLATE.format_map({
+        'id': system['id'],
+        'name': system['name'],
+        'type': system.get('type', 'system'),
+        'hash': digest,
+    }))
 
 
-def generate_overview(system: Dict[str, Any]) -> str:
+def generate_overview(system: Dict[str, Any], out: List[str]) -> None:
     """Generate overview section - always same structure."""
-    overview = [
-        f"# {system['name']}",
-        "",
-        "## Overview",
-        "",
-        f"**Type**: {system.get('type', 'N/A')}",
-        f"**Scope**: {system.get('boundaries', {}).get('scope', 'N/A')}",
-    ]
+    out.extend((
+        f"# {system['name']}\n",
+        "\n",
+        "## Overview\n",
+        "\n",
+        f"**Type**: {system.get('type', 'N/A')}\n",
+        f"**Scope**: {system.get('boundaries', {}).get('scope', 'N/A')}\n",
+    ))
 
     if system.get('repositories'):
-        overview.append("")
-        overview.append("**Repositories**:")
+        out.append("\n")
+        out.append("**Repositories**:\n")
         for repo in system['repositories']:
-            overview.append(f"- `{repo}`")
-
-    return "\n".join(overview)
+            out.append(f"- `{repo}`\n")
 
 
-def generate_observations(system: Dict[str, Any]) -> str:
+def generate_observations(system: Dict[str, Any], out: List[str]) -> None:
     """Generate observations section - always grouped by category."""
-    if not system.get('observations'):
-        return "## Observations\n\nNo observations documented."
-
-    sections = ["## Observations", ""]
-    obs_by_category = group_by_category(system['observations'])
-
-    # Always sort categories alphabetically for consistency
-    for category in sorted(obs_by_category.keys()):
-        sections.append(f"### {category.replace('-', ' ').title()}")
-        sections.append("")
-
-        # Sort by severity: critical > warning > info
-        severity_order = {'critical': 0, 'warning': 1, 'info': 2}
-        obs_list = sorted(
-            obs_by_category[category],
-            key=lambda x: severity_order.get(x.get('severity', 'info'), 3)
-        )
+    render_observations(system.get('observations'), out, show_evidence=True, show_snippets=True)
 
-        for obs in obs_list:
-            severity = obs.get('severity', 'info')
-            icon = {'critical': '🔴', 'warning': '⚠️', 'info': 'ℹ️'}.get(severity, '')
 
-            sections.append(f"- {icon} **{obs.get('description', 'No description')}**")
-
-            # Add evidence if present
-            if obs.get('evidence'):
-                ev = obs['evidence']
-                sections.append(f"  - Evidence: `{ev.get('location', 'N/A')}`")
-                if ev.get('snippet'):
-                    sections.append(f"  ```{ev.get('type', 'text')}")
-                    sections.append(f"  {ev['snippet']}")
-                    sections.append("  ```")
-
-            # Add tags if present
-            if obs.get('tags'):
-                tags = ' '.join(f"`{tag}`" for tag in obs['tags'])
-                sections.append(f"  - Tags: {tags}")
-
-            sections.append("")
-
-    return "\n".join(sections)
-
-
-def generate_relations(system: Dict[str, Any]) -> str:
+def generate_relations(system: Dict[str, Any], out: List[str]) -> None:
     """Generate relations section - always table format."""
     if not system.get('relations'):
-        return "## Relations\n\nNo relations documented."
+        out.append("## Relations\n\nNo relations documented.\n")
+        return
 
-    sections = [
-        "## Relations",
-        "",
-        "| Target | Type | Direction | Description |",
-        "|--------|------|-----------|-------------|"
-    ]
+    out.extend((
+        "## Relations\n",
+        "\n",
+        "| Target | Type | Direction | Description |\n",
+        "|--------|------|-----------|-------------|\n",
+    ))
 
     for rel in system['relations']:
         target = rel.get('target', 'N/A')
@@ -122,21 +105,22 @@ def generate_relations(system: Dict[str, Any]) -> str:
         direction = rel.get('direction', 'N/A')
         description = rel.get('description', 'N/A')
 
-        sections.append(f"| {target} | `{rel_type}` | {direction} | {description} |")
-
-    return "\n".join(sections)
+        out.append(f"| {target} | `{rel_type}` | {direction} | {description} |\n")
 
 
-def generate_metadata(system: Dict[str, Any], source_file: str) -> str:
+def generate_metadata(system: Dict[str, Any], source_file: str, out: List[str]) -> None:
     """Generate metadata section - always same structure."""
-    return f"""## Metadata
-
-**Source**: {source_file}
-**Level**: C1 (System Context)
-**ID**: `{system['id']}`"""
+    out.append(METADATA_TEMPLATE.format_map({
+        'source_file': source_file,
+        'id': system['id'],
+    }))
 
 
-def generate_c1_markdown(system: Dict[str, Any], source_file: str = "c1-systems.json") -> str:
+def generate_c1_markdown(
+    system: Dict[str, Any],
+    source_file: str = "c1-systems.json",
+    digest: Optional[str] = None,
+) -> str:
     """
     Generate complete C1 markdown from system JSON.
 
@@ -148,16 +132,78 @@ def generate_c1_markdown(system: Dict[str, Any], source_file: str = "c1-systems.
     5. Metadata
 
     This ensures CONSISTENCY - no duplicate sections, no random ordering.
+
+    Each section appends newline-terminated lines to one shared list, with a
+    blank line between sections, so the document is joined exactly once.
+    """
+    if digest is None:
+        digest = content_hash(system, source_file)
+
+    out: List[str] = []
+    generate_frontmatter(system, digest, out)
+    out.append("\n")
+    generate_overview(system, out)
+    out.append("\n")
+    generate_observations(system, out)
+    out.append("\n")
+    generate_relations(system, out)
+    out.append("\n")
+    generate_metadata(system, source_file, out)
+
+    return "".join(out)
+
+
+def write_c1_markdown(system: Dict[str, Any], source_file: str, output_file: Path) -> Tuple[Path, bool]:
     """
-    sections = [
-        generate_frontmatter(system),
-        generate_overview(system),
-        generate_observations(system),
-        generate_relations(system),
-        generate_metadata(system, source_file)
-    ]
+    Render one system to output_file (also used by worker processes).
+
+    Files whose frontmatter hash matches the current input are left alone.
+    Returns the output path and whether it was (re)written.
+    """
+    digest = content_hash(system, source_file)
+    if is_up_to_date(output_file, digest):
+        return output_file, False
+
+    output_file.write_bytes(generate_c1_markdown(system, source_file, digest).encode('utf-8'))
+    return output_file, True
+
+
+def output_file_for(system: Dict[str, Any], ensured_dirs: Set[Path]) -> Optional[Path]:
+    """Return where a system's markdown goes (None to skip it), creating its directory once per run."""
+    system_id = system.get('id')
+    if not system_id:
+        print("Warning: System without ID, skipping")
+        return None
+
+    output_dir = KB_SYSTEMS.joinpath(str(system_id), "c1")
+    if output_dir not in ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        ensured_dirs.add(output_dir)
+
+    return output_dir / "README.md"
+
+
+def generate_streamed(systems: Iterator[Dict[str, Any]], json_file: str) -> Tuple[int, int]:
+    """Render systems one at a time as they are parsed, so memory stays flat; returns (written, unchanged)."""
+    print(f"Generating markdown for systems in {json_file} (streaming)...")
 
-    return "\n\n".join(sections) + "\n"
+    ensured_dirs: Set[Path] = set()
+    count = written = unchanged = 0
+    try:
+        for system in systems:
+            count += 1
+            output_file = output_file_for(system, ensured_dirs)
+            if output_file is not None:
+                w, u = report_written((write_c1_markdown(system, json_file, output_file),))
+                written += w
+                unchanged += u
+    except JSON_ERRORS as e:
+        print(f"Error: Invalid JSON in {json_file}: {e}")
+        sys.exit(2)
+
+    if not count:
+        print("Warning: No systems found in JSON")
+    return written, unchanged
 
 
 def main():
@@ -168,10 +214,16 @@ def main():
 
     json_file = sys.argv[1]
 
+    # Very large inputs are parsed incrementally when ijson is installed
+    streamed = stream_items(json_file, 'systems')
+    if streamed is not None:
+        report_done(*generate_streamed(streamed, json_file))
+        return
+
     # Load JSON
     try:
-        with open(json_file) as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found: {json_file}")
         sys.exit(2)
@@ -187,25 +239,26 @@ def main():
 
     print(f"Generating markdown for {len(systems)} system(s)...")
 
-    for system in systems:
-        system_id = system.get('id')
-        if not system_id:
-            print("Warning: System without ID, skipping")
-            continue
+    # Output directories already created during this run
+    ensured_dirs: Set[Path] = set()
+    pending: List[Dict[str, Any]] = []
+    output_files: List[Path] = []
 
-        # Generate markdown
-        markdown = generate_c1_markdown(system, json_file)
-
-        # Write to file
-        output_dir = Path(f"knowledge-base/systems/{system_id}/c1")
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_file = output_dir / "README.md"
-        output_file.write_text(markdown)
-
-        print(f"✓ Generated: {output_file}")
-
-    print(f"\nDone! Generated {len(systems)} markdown file(s)")
+    for system in systems:
+        output_file = output_file_for(system, ensured_dirs)
+        if output_file is not None:
+            pending.append(system)
+            output_files.append(output_file)
+
+    # Each system renders independently; fan out to worker processes only when
+    # there are enough of them to pay for the pool start-up
+    if len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            counts = report_written(executor.map(write_c1_markdown, pending, repeat(json_file), output_files, chunksize=8))
+    else:
+        counts = report_written(map(write_c1_markdown, pending, repeat(json_file), output_files))
+
+    report_done(*counts)
 
 
 if __name__ == "__main__":
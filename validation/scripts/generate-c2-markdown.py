@@ -13,182 +13,235 @@ Output:
 """
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
-
-
-def group_by_category(observations: List[Dict]) -> Dict[str, List[Dict]]:
-    """Group observations by category."""
-    grouped = {}
-    for obs in observations:
-        category = obs.get('category', 'uncategorized')
-        if category not in grouped:
-            grouped[category] = []
-        grouped[category].append(obs)
-    return grouped
-
-
-def generate_frontmatter(container: Dict[str, Any]) -> str:
-    """Generate YAML frontmatter - always same structure."""
-    return f"""---
-id: {container['id']}
-title: {container['name']}
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+
+from _c_common import (
+    JSON_ERRORS,
+    content_hash,
+    is_up_to_date,
+    json_loads,
+    render_observations,
+    report_done,
+    report_written,
+    stream_items,
+)
+
+# Every generated file lives under this directory
+KB_SYSTEMS = Path("knowledge-base/systems")
+
+# Below this many containers a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Fixed section templates, filled in with str.format_map
+FRONTMATTER_TEMPLATE = """---
+id: {id}
+title: {name}
 level: c2
-type: {container.get('type', 'container')}
-system: {container.get('system_id', 'unknown')}
+type: {type}
+system: {system_id}
 generated: auto
----"""
+hash: {hash}
+---
+"""
+METADATA_TEMPLATE = """## Metadata
 
+**Source**: {source_file}
+**Level**: C2 (Container)
+**ID**: `{id}`
+**System**: `{system_id}`
+"""
 
-def generate_overview(container: Dict[str, Any]) -> str:
-    """Generate overview section - always same structure."""
-    overview = [
-        f"# {container['name']}",
-        "",
-        "## Overview",
-        "",
-        f"**Type**: {container.get('type', 'N/A')}",
-        f"**System**: {container.get('system_id', 'N/A')}",
-        f"**Responsibility**: {container.get('responsibility', 'N/A')}",
-    ]
 
-    return "\n".join(overview)
+def generate_frontmatter(container: Dict[str, Any], digest: str, out: List[str]) -> None:
+    """Generate YAML frontmatter - always same structure."""
+    out.append(FRONTMATTER_TEMPLATE.format_map({
+        'id': container['id'],
+        'name': container['name'],
+        'type': container.get('type', 'container'),
+        'system_id': container.get('system_id', 'unknown'),
+        'hash': digest,
+    }))
 
 
-def generate_technology_stack(container: Dict[str, Any]) -> str:
+def generate_overview(container: Dict[str, Any], out: List[str]) -> None:
+    """Generate overview section - always same structure."""
+    out.extend((
+        f"# {container['name']}\n",
+        "\n",
+        "## Overview\n",
+        "\n",
+        f"**Type**: {container.get('type', 'N/A')}\n",
+        f"**System**: {container.get('system_id', 'N/A')}\n",
+        f"**Responsibility**: {container.get('responsibility', 'N/A')}\n",
+    ))
+
+
+def generate_technology_stack(container: Dict[str, Any], out: List[str]) -> None:
     """Generate technology stack section - always same structure."""
     tech = container.get('technology', {})
 
-    sections = [
-        "## Technology Stack",
-        "",
-        f"**Primary Language**: {tech.get('primary_language', 'N/A')}",
-        f"**Framework**: {tech.get('framework', 'N/A')}",
-    ]
+    out.extend((
+        "## Technology Stack\n",
+        "\n",
+        f"**Primary Language**: {tech.get('primary_language', 'N/A')}\n",
+        f"**Framework**: {tech.get('framework', 'N/A')}\n",
+    ))
 
     # Libraries
     if tech.get('libraries'):
-        sections.append("")
-        sections.append("**Libraries**:")
-        sections.append("")
-        sections.append("| Name | Version | Purpose |")
-        sections.append("|------|---------|---------|")
+        out.append("\n")
+        out.append("**Libraries**:\n")
+        out.append("\n")
+        out.append("| Name | Version | Purpose |\n")
+        out.append("|------|---------|---------|\n")
 
         for lib in tech['libraries']:
             name = lib.get('name', 'N/A')
             version = lib.get('version', 'N/A')
             purpose = lib.get('purpose', 'N/A')
-            sections.append(f"| {name} | {version} | {purpose} |")
-
-    return "\n".join(sections)
+            out.append(f"| {name} | {version} | {purpose} |\n")
 
 
-def generate_runtime(container: Dict[str, Any]) -> str:
+def generate_runtime(container: Dict[str, Any], out: List[str]) -> None:
     """Generate runtime section - always same structure."""
     runtime = container.get('runtime', {})
 
-    sections = [
-        "## Runtime Environment",
-        "",
-        f"**Environment**: {runtime.get('environment', 'N/A')}",
-        f"**Platform**: {runtime.get('platform', 'N/A')}",
-        f"**Containerized**: {runtime.get('containerized', False)}",
-    ]
+    out.extend((
+        "## Runtime Environment\n",
+        "\n",
+        f"**Environment**: {runtime.get('environment', 'N/A')}\n",
+        f"**Platform**: {runtime.get('platform', 'N/A')}\n",
+        f"**Containerized**: {runtime.get('containerized', False)}\n",
+    ))
 
     if runtime.get('containerized'):
-        sections.append(f"**Container Technology**: {runtime.get('container_technology', 'N/A')}")
-
-    return "\n".join(sections)
+        out.append(f"**Container Technology**: {runtime.get('container_technology', 'N/A')}\n")
 
 
-def generate_observations(container: Dict[str, Any]) -> str:
+def generate_observations(container: Dict[str, Any], out: List[str]) -> None:
     """Generate observations section - always grouped by category."""
-    if not container.get('observations'):
-        return "## Observations\n\nNo observations documented."
+    render_observations(container.get('observations'), out, show_evidence=True)
 
-    sections = ["## Observations", ""]
-    obs_by_category = group_by_category(container['observations'])
 
-    # Always sort categories alphabetically for consistency
-    for category in sorted(obs_by_category.keys()):
-        sections.append(f"### {category.replace('-', ' ').title()}")
-        sections.append("")
-
-        # Sort by severity
-        severity_order = {'critical': 0, 'warning': 1, 'info': 2}
-        obs_list = sorted(
-            obs_by_category[category],
-            key=lambda x: severity_order.get(x.get('severity', 'info'), 3)
-        )
-
-        for obs in obs_list:
-            severity = obs.get('severity', 'info')
-            icon = {'critical': '🔴', 'warning': '⚠️', 'info': 'ℹ️'}.get(severity, '')
-
-            sections.append(f"- {icon} **{obs.get('description', 'No description')}**")
-
-            if obs.get('evidence'):
-                ev = obs['evidence']
-                sections.append(f"  - Evidence: `{ev.get('location', 'N/A')}`")
-
-            if obs.get('tags'):
-                tags = ' '.join(f"`{tag}`" for tag in obs['tags'])
-                sections.append(f"  - Tags: {tags}")
-
-            sections.append("")
-
-    return "\n".join(sections)
-
-
-def generate_relations(container: Dict[str, Any]) -> str:
+def generate_relations(container: Dict[str, Any], out: List[str]) -> None:
     """Generate relations section - always table format."""
     if not container.get('relations'):
-        return "## Relations\n\nNo relations documented."
+        out.append("## Relations\n\nNo relations documented.\n")
+        return
 
-    sections = [
-        "## Relations",
-        "",
-        "| Target | Type | Description |",
-        "|--------|------|-------------|"
-    ]
+    out.extend((
+        "## Relations\n",
+        "\n",
+        "| Target | Type | Description |\n",
+        "|--------|------|-------------|\n",
+    ))
 
     for rel in container['relations']:
         target = rel.get('target', 'N/A')
         rel_type = rel.get('type', 'N/A')
         description = rel.get('description', 'N/A')
 
-        sections.append(f"| {target} | `{rel_type}` | {description} |")
+        out.append(f"| {target} | `{rel_type}` | {description} |\n")
 
-    return "\n".join(sections)
 
-
-def generate_metadata(container: Dict[str, Any], source_file: str) -> str:
+def generate_metadata(container: Dict[str, Any], source_file: str, out: List[str]) -> None:
     """Generate metadata section - always same structure."""
-    return f"""## Metadata
-
-**Source**: {source_file}
-**Level**: C2 (Container)
-**ID**: `{container['id']}`
-**System**: `{container.get('system_id', 'N/A')}`"""
-
-
-def generate_c2_markdown(container: Dict[str, Any], source_file: str = "c2-containers.json") -> str:
+    out.append(METADATA_TEMPLATE.format_map({
+        'source_file': source_file,
+        'id': container['id'],
+        'system_id': container.get('system_id', 'N/A'),
+    }))
+
+
+def generate_c2_markdown(
+    container: Dict[str, Any],
+    source_file: str = "c2-containers.json",
+    digest: Optional[str] = None,
+) -> str:
     """
     Generate complete C2 markdown from container JSON.
 
     ALWAYS generates the same structure - ensures CONSISTENCY.
+
+    Sections append lines to one shared list that is joined exactly once.
     """
-    sections = [
-        generate_frontmatter(container),
-        generate_overview(container),
-        generate_technology_stack(container),
-        generate_runtime(container),
-        generate_observations(container),
-        generate_relations(container),
-        generate_metadata(container, source_file)
-    ]
+    if digest is None:
+        digest = content_hash(container, source_file)
+
+    out: List[str] = []
+    generate_frontmatter(container, digest, out)
+    out.append("\n")
+    generate_overview(container, out)
+    out.append("\n")
+    generate_technology_stack(container, out)
+    out.append("\n")
+    generate_runtime(container, out)
+    out.append("\n")
+    generate_observations(container, out)
+    out.append("\n")
+    generate_relations(container, out)
+    out.append("\n")
+    generate_metadata(container, source_file, out)
+
+    return "".join(out)
+
+
+def write_c2_markdown(container: Dict[str, Any], source_file: str, output_file: Path) -> Tuple[Path, bool]:
+    """
+    Render one container to output_file (also used by worker processes).
+
+    Files whose frontmatter hash matches the current input are left alone.
+    Returns the output path and whether it was (re)written.
+    """
+    digest = content_hash(container, source_file)
+    if is_up_to_date(output_file, digest):
+        return output_file, False
+
+    output_file.write_bytes(generate_c2_markdown(container, source_file, digest).encode('utf-8'))
+    return output_file, True
+
+
+def output_file_for(container: Dict[str, Any], ensured_dirs: Set[Path]) -> Optional[Path]:
+    """Return where a container's markdown goes (None to skip it), creating its directory once per run."""
+    container_id = container.get('id')
+    system_id = container.get('system_id')
+
+    if not container_id or not system_id:
+        print("Warning: Container without ID or system_id, skipping")
+        return None
+
+    output_dir = KB_SYSTEMS.joinpath(str(system_id), "c2")
+    if output_dir not in ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        ensured_dirs.add(output_dir)
+
+    return output_dir / f"{container_id}.md"
+
+
+def generate_streamed(containers: Iterator[Dict[str, Any]], json_file: str) -> Tuple[int, int]:
+    """Render containers one at a time as they are parsed, so memory stays flat; returns (written, unchanged)."""
+    print(f"Generating markdown for containers in {json_file} (streaming)...")
 
-    return "\n\n".join(sections) + "\n"
+    ensured_dirs: Set[Path] = set()
+    count = written = unchanged = 0
+    try:
+        for container in containers:
+            count += 1
+            output_file = output_file_for(container, ensured_dirs)
+            if output_file is not None:
+                w, u = report_written((write_c2_markdown(container, json_file, output_file),))
+                written += w
+                unchanged += u
+    except JSON_ERRORS as e:
+        print(f"Error: Invalid JSON in {json_file}: {e}")
+        sys.exit(2)
+
+    if not count:
+        print("Warning: No containers found in JSON")
+    return written, unchanged
 
 
 def main():
@@ -199,10 +252,16 @@ def main():
 
     json_file = sys.argv[1]
 
+    # Very large inputs are parsed incrementally when ijson is installed
+    streamed = stream_items(json_file, 'containers')
+    if streamed is not None:
+        report_done(*generate_streamed(streamed, json_file))
+        return
+
     # Load JSON
     try:
-        with open(json_file) as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found: {json_file}")
         sys.exit(2)
@@ -218,27 +277,26 @@ def main():
 
     print(f"Generating markdown for {len(containers)} container(s)...")
 
-    for container in containers:
-        container_id = container.get('id')
-        system_id = container.get('system_id')
-
-        if not container_id or not system_id:
-            print("Warning: Container without ID or system_id, skipping")
-            continue
-
-        # Generate markdown
-        markdown = generate_c2_markdown(container, json_file)
-
-        # Write to file
-        output_dir = Path(f"knowledge-base/systems/{system_id}/c2")
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Output directories already created during this run
+    ensured_dirs: Set[Path] = set()
+    pending: List[Dict[str, Any]] = []
+    output_files: List[Path] = []
 
-        output_file = output_dir / f"{container_id}.md"
-        output_file.write_text(markdown)
-
-        print(f"✓ Generated: {output_file}")
-
-    print(f"\nDone! Generated {len(containers)} markdown file(s)")
+    for container in containers:
+        output_file = output_file_for(container, ensured_dirs)
+        if output_file is not None:
+            pending.append(container)
+            output_files.append(output_file)
+
+    # Each container renders independently; fan out to worker processes only when
+    # there are enough of them to pay for the pool start-up
+    if len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            counts = report_written(executor.map(write_c2_markdown, pending, repeat(json_file), output_files, chunksize=8))
+    else:
+        counts = report_written(map(write_c2_markdown, pending, repeat(json_file), output_files))
+
+    report_done(*counts)
 
 
 if __name__ == "__main__":
@@ -13,173 +13,164 @@ Output:
 """
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
-
-
-def group_by_category(observations: List[Dict]) -> Dict[str, List[Dict]]:
-    """Group observations by category."""
-    grouped = {}
-    for obs in observations:
-        category = obs.get('category', 'uncategorized')
-        if category not in grouped:
-            grouped[category] = []
-        grouped[category].append(obs)
-    return grouped
-
-
-def generate_frontmatter(component: Dict[str, Any]) -> str:
-    """Generate YAML frontmatter - always same structure."""
-    return f"""---
-id: {component['id']}
-title: {component['name']}
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+
+from _c_common import (
+    JSON_ERRORS,
+    content_hash,
+    is_up_to_date,
+    json_loads,
+    render_observations,
+    report_done,
+    report_written,
+    stream_items,
+)
+
+# Every generated file lives under this directory
+KB_SYSTEMS = Path("knowledge-base/systems")
+
+# Below this many components a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Fixed section templates, filled in with str.format_map
+FRONTMATTER_TEMPLATE = """---
+id: {id}
+title: {name}
 level: c3
-type: {component.get('type', 'component')}
-container: {component.get('container_id', 'unknown')}
+type: {type}
+container: {container_id}
 generated: auto
----"""
+hash: {hash}
+---
+"""
+METADATA_TEMPLATE = """## Metadata
 
+**Source**: {source_file}
+**Level**: C3 (Component)
+**ID**: `{id}`
+**Container**: `{container_id}`
+"""
 
-def generate_overview(component: Dict[str, Any]) -> str:
-    """Generate overview section - always same structure."""
-    overview = [
-        f"# {component['name']}",
-        "",
-        "## Overview",
-        "",
-        f"**Type**: {component.get('type', 'N/A')}",
-        f"**Container**: {component.get('container_id', 'N/A')}",
-        f"**Responsibility**: {component.get('responsibility', 'N/A')}",
-    ]
 
-    return "\n".join(overview)
+def generate_frontmatter(component: Dict[str, Any], digest: str, out: List[str]) -> None:
+    """Generate YAML frontmatter - always same structure."""
+    out.append(FRONTMATTER_TEMPLATE.format_map({
+        'id': component['id'],
+        'name': component['name'],
+        'type': component.get('type', 'component'),
+        'container_id': component.get('container_id', 'unknown'),
+        'hash': digest,
+    }))
 
 
-def generate_code_structure(component: Dict[str, Any]) -> str:
+def generate_overview(component: Dict[str, Any], out: List[str]) -> None:
+    """Generate overview section - always same structure."""
+    out.extend((
+        f"# {component['name']}\n",
+        "\n",
+        "## Overview\n",
+        "\n",
+        f"**Type**: {component.get('type', 'N/A')}\n",
+        f"**Container**: {component.get('container_id', 'N/A')}\n",
+        f"**Responsibility**: {component.get('responsibility', 'N/A')}\n",
+    ))
+
+
+def generate_code_structure(component: Dict[str, Any], out: List[str]) -> None:
     """Generate code structure section - always same structure."""
     structure = component.get('structure', {})
 
-    sections = [
-        "## Code Structure",
-        "",
-        f"**Path**: `{structure.get('path', 'N/A')}`",
-        f"**Language**: {structure.get('language', 'N/A')}",
-    ]
+    out.extend((
+        "## Code Structure\n",
+        "\n",
+        f"**Path**: `{structure.get('path', 'N/A')}`\n",
+        f"**Language**: {structure.get('language', 'N/A')}\n",
+    ))
 
     # Files
     if structure.get('files'):
-        sections.append("")
-        sections.append("**Files**:")
-        sections.append("")
+        out.append("\n")
+        out.append("**Files**:\n")
+        out.append("\n")
 
         for file_info in structure['files']:
             path = file_info.get('path', 'N/A')
             lines = file_info.get('lines', 0)
             file_type = file_info.get('type', 'N/A')
-            sections.append(f"- `{path}` ({lines} lines, {file_type})")
+            out.append(f"- `{path}` ({lines} lines, {file_type})\n")
 
     # Exports
     if structure.get('exports'):
-        sections.append("")
-        sections.append("**Exports**:")
-        sections.append("")
+        out.append("\n")
+        out.append("**Exports**:\n")
+        out.append("\n")
 
         for export in structure['exports']:
             name = export.get('name', 'N/A')
             export_type = export.get('type', 'N/A')
-            sections.append(f"- `{name}` ({export_type})")
+            out.append(f"- `{name}` ({export_type})\n")
 
-    return "\n".join(sections)
 
-
-def generate_patterns(component: Dict[str, Any]) -> str:
+def generate_patterns(component: Dict[str, Any], out: List[str]) -> None:
     """Generate design patterns section - always same structure."""
     patterns = component.get('patterns', [])
 
     if not patterns:
-        return "## Design Patterns\n\nNo patterns identified."
+        out.append("## Design Patterns\n\nNo patterns identified.\n")
+        return
 
-    sections = ["## Design Patterns", ""]
+    out.append("## Design Patterns\n\n")
 
     for pattern in patterns:
         name = pattern.get('name', 'Unknown')
         category = pattern.get('category', 'N/A')
         description = pattern.get('description', 'No description')
 
-        sections.append(f"### {name}")
-        sections.append(f"**Category**: {category}")
-        sections.append(f"{description}")
-        sections.append("")
-
-    return "\n".join(sections)
+        out.append(f"### {name}\n")
+        out.append(f"**Category**: {category}\n")
+        out.append(f"{description}\n")
+        out.append("\n")
 
 
-def generate_metrics(component: Dict[str, Any]) -> str:
+def generate_metrics(component: Dict[str, Any], out: List[str]) -> None:
     """Generate metrics section - always same structure."""
     metrics = component.get('metrics', {})
 
     if not metrics:
-        return "## Metrics\n\nNo metrics available."
-
-    sections = [
-        "## Metrics",
-        "",
-        "| Metric | Value |",
-        "|--------|-------|",
-        f"| Lines of Code | {metrics.get('lines_of_code', 'N/A')} |",
-        f"| Cyclomatic Complexity | {metrics.get('cyclomatic_complexity', 'N/A')} |",
-        f"| Test Coverage | {metrics.get('test_coverage', 'N/A')}% |",
-    ]
+        out.append("## Metrics\n\nNo metrics available.\n")
+        return
 
-    return "\n".join(sections)
+    out.extend((
+        "## Metrics\n",
+        "\n",
+        "| Metric | Value |\n",
+        "|--------|-------|\n",
+        f"| Lines of Code | {metrics.get('lines_of_code', 'N/A')} |\n",
+        f"| Cyclomatic Complexity | {metrics.get('cyclomatic_complexity', 'N/A')} |\n",
+        f"| Test Coverage | {metrics.get('test_coverage', 'N/A')}% |\n",
+    ))
 
 
-def generate_observations(component: Dict[str, Any]) -> str:
+def generate_observations(component: Dict[str, Any], out: List[str]) -> None:
     """Generate observations section - always grouped by category."""
-    if not component.get('observations'):
-        return "## Observations\n\nNo observations documented."
+    render_observations(component.get('observations'), out)
 
-    sections = ["## Observations", ""]
-    obs_by_category = group_by_category(component['observations'])
 
-    # Always sort categories alphabetically for consistency
-    for category in sorted(obs_by_category.keys()):
-        sections.append(f"### {category.replace('-', ' ').title()}")
-        sections.append("")
-
-        # Sort by severity
-        severity_order = {'critical': 0, 'warning': 1, 'info': 2}
-        obs_list = sorted(
-            obs_by_category[category],
-            key=lambda x: severity_order.get(x.get('severity', 'info'), 3)
-        )
-
-        for obs in obs_list:
-            severity = obs.get('severity', 'info')
-            icon = {'critical': '🔴', 'warning': '⚠️', 'info': 'ℹ️'}.get(severity, '')
-
-            sections.append(f"- {icon} **{obs.get('description', 'No description')}**")
-
-            if obs.get('tags'):
-                tags = ' '.join(f"`{tag}`" for tag in obs['tags'])
-                sections.append(f"  - Tags: {tags}")
-
-            sections.append("")
-
-    return "\n".join(sections)
-
-
-def generate_relations(component: Dict[str, Any]) -> str:
+def generate_relations(component: Dict[str, Any], out: List[str]) -> None:
     """Generate relations section - always table format."""
     if not component.get('relations'):
-        return "## Relations\n\nNo relations documented."
+        out.append("## Relations\n\nNo relations documented.\n")
+        return
 
-    sections = [
-        "## Relations",
-        "",
-        "| Target | Type | Coupling | Description |",
-        "|--------|------|----------|-------------|"
-    ]
+    out.extend((
+        "## Relations\n",
+        "\n",
+        "| Target | Type | Coupling | Description |\n",
+        "|--------|------|----------|-------------|\n",
+    ))
 
     for rel in component['relations']:
         target = rel.get('target', 'N/A')
@@ -187,39 +178,111 @@ def generate_relations(component: Dict[str, Any]) -> str:
         coupling = rel.get('coupling', 'N/A')
         description = rel.get('description', 'N/A')
 
-        sections.append(f"| {target} | `{rel_type}` | {coupling} | {description} |")
-
-    return "\n".join(sections)
+        out.append(f"| {target} | `{rel_type}` | {coupling} | {description} |\n")
 
 
-def generate_metadata(component: Dict[str, Any], source_file: str) -> str:
+def generate_metadata(component: Dict[str, Any], source_file: str, out: List[str]) -> None:
     """Generate metadata section - always same structure."""
-    return f"""## Metadata
-
-**Source**: {source_file}
-**Level**: C3 (Component)
-**ID**: `{component['id']}`
-**Container**: `{component.get('container_id', 'N/A')}`"""
-
-
-def generate_c3_markdown(component: Dict[str, Any], source_file: str = "c3-components.json") -> str:
+    out.append(METADATA_TEMPLATE.format_map({
+        'source_file': source_file,
+        'id': component['id'],
+        'container_id': component.get('container_id', 'N/A'),
+    }))
+
+
+def generate_c3_markdown(
+    component: Dict[str, Any],
+    source_file: str = "c3-components.json",
+    digest: Optional[str] = None,
+) -> str:
     """
     Generate complete C3 markdown from component JSON.
 
     ALWAYS generates the same structure - ensures CONSISTENCY.
+
+    Sections append lines to one shared list that is joined exactly once.
+    """
+    if digest is None:
+        digest = content_hash(component, source_file)
+
+    out: List[str] = []
+    generate_frontmatter(component, digest, out)
+    out.append("\n")
+    generate_overview(component, out)
+    out.append("\n")
+    generate_code_structure(component, out)
+    out.append("\n")
+    generate_patterns(component, out)
+    out.append("\n")
+    generate_metrics(component, out)
+    out.append("\n")
+    generate_observations(component, out)
+    out.append("\n")
+    generate_relations(component, out)
+    out.append("\n")
+    generate_metadata(component, source_file, out)
+
+    return "".join(out)
+
+
+def write_c3_markdown(component: Dict[str, Any], source_file: str, output_file: Path) -> Tuple[Path, bool]:
+    """
+    Render one component to output_file (also used by worker processes).
+
+    Files whose frontmatter hash matches the current input are left alone.
+    Returns the output path and whether it was (re)written.
     """
-    sections = [
-        generate_frontmatter(component),
-        generate_overview(component),
-        generate_code_structure(component),
-        generate_patterns(component),
-        generate_metrics(component),
-        generate_observations(component),
-        generate_relations(component),
-        generate_metadata(component, source_file)
-    ]
+    digest = content_hash(component, source_file)
+    if is_up_to_date(output_file, digest):
+        return output_file, False
 
-    return "\n\n".join(sections) + "\n"
+    output_file.write_bytes(generate_c3_markdown(component, source_file, digest).encode('utf-8'))
+    return output_file, True
+
+
+def output_file_for(component: Dict[str, Any], ensured_dirs: Set[Path]) -> Optional[Path]:
+    """Return where a component's markdown goes (None to skip it), creating its directory once per run."""
+    component_id = component.get('id')
+    container_id = component.get('container_id')
+
+    if not component_id or not container_id:
+        print("Warning: Component without ID or container_id, skipping")
+        return None
+
+    # Note: We need to know system_id to create correct path
+    # This would typically come from reading c2-containers.json first
+    # For now, we'll use a placeholder approach
+    system_id = "unknown-system"  # TODO: Map container_id to system_id
+
+    output_dir = KB_SYSTEMS.joinpath(system_id, "c3")
+    if output_dir not in ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        ensured_dirs.add(output_dir)
+
+    return output_dir / f"{component_id}.md"
+
+
+def generate_streamed(components: Iterator[Dict[str, Any]], json_file: str) -> Tuple[int, int]:
+    """Render components one at a time as they are parsed, so memory stays flat; returns (written, unchanged)."""
+    print(f"Generating markdown for components in {json_file} (streaming)...")
+
+    ensured_dirs: Set[Path] = set()
+    count = written = unchanged = 0
+    try:
+        for component in components:
+            count += 1
+            output_file = output_file_for(component, ensured_dirs)
+            if output_file is not None:
+                w, u = report_written((write_c3_markdown(component, json_file, output_file),))
+                written += w
+                unchanged += u
+    except JSON_ERRORS as e:
+        print(f"Error: Invalid JSON in {json_file}: {e}")
+        sys.exit(2)
+
+    if not count:
+        print("Warning: No components found in JSON")
+    return written, unchanged
 
 
 def main():
@@ -230,10 +293,16 @@ def main():
 
     json_file = sys.argv[1]
 
+    # Very large inputs are parsed incrementally when ijson is installed
+    streamed = stream_items(json_file, 'components')
+    if streamed is not None:
+        report_done(*generate_streamed(streamed, json_file))
+        return
+
     # Load JSON
     try:
-        with open(json_file) as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found: {json_file}")
         sys.exit(2)
@@ -249,32 +318,26 @@ def main():
 
     print(f"Generating markdown for {len(components)} component(s)...")
 
-    for component in components:
-        component_id = component.get('id')
-        container_id = component.get('container_id')
-
-        if not component_id or not container_id:
-            print("Warning: Component without ID or container_id, skipping")
-            continue
+    # Output directories already created during this run
+    ensured_dirs: Set[Path] = set()
+    pending: List[Dict[str, Any]] = []
+    output_files: List[Path] = []
 
-        # Note: We need to know system_id to create correct path
-        # This would typically come from reading c2-containers.json first
-        # For now, we'll use a placeholder approach
-        system_id = "unknown-system"  # TODO: Map container_id to system_id
-
-        # Generate markdown
-        markdown = generate_c3_markdown(component, json_file)
-
-        # Write to file
-        output_dir = Path(f"knowledge-base/systems/{system_id}/c3")
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_file = output_dir / f"{component_id}.md"
-        output_file.write_text(markdown)
-
-        print(f"✓ Generated: {output_file}")
-
-    print(f"\nDone! Generated {len(components)} markdown file(s)")
+    for component in components:
+        output_file = output_file_for(component, ensured_dirs)
+        if output_file is not None:
+            pending.append(component)
+            output_files.append(output_file)
+
+    # Each component renders independently; fan out to worker processes only when
+    # there are enough of them to pay for the pool start-up
+    if len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            counts = report_written(executor.map(write_c3_markdown, pending, repeat(json_file), output_files, chunksize=8))
+    else:
+        counts = report_written(map(write_c3_markdown, pending, repeat(json_file), output_files))
+
+    report_done(*counts)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,20 @@
 """
 Validate c1-systems.json structure.
 
+Usage:
+  validate-c1-systems.py            validate knowledge-base/systems/*/c1-systems.json
+  validate-c1-systems.py --daemon   validate one JSON document per stdin line and
+                                    print its exit code on stdout, so a batch
+                                    pays for interpreter start-up only once
+
 Exit codes:
   0 - Validation passed
   1 - Non-blocking warning (continue with user notification)
   2 - Blocking error (halt workflow immediately)
+
+Environment:
+  MELLY_FAIL_FAST - if set, stop checking a file at the first system with an
+                    error (for CI gates that only need the exit code)
 """
 
 import sys
@@ -13,40 +23,60 @@ import json
 import os
 import re
 import glob
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Set
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Tuple, Any, Set
+
+try:
+    # orjson is an optional, much faster drop-in for decoding the input files
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# ID pattern (always applied with fullmatch, so no anchors are needed)
+ID_PATTERN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+match_id = ID_PATTERN.fullmatch
 
+# Stop at the first system with an error (the exit code is 2 either way)
+FAIL_FAST = bool(os.environ.get("MELLY_FAIL_FAST"))
 
-# ID pattern
-ID_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+# Required fields, in the order missing ones are reported
+SYSTEM_REQUIRED_FIELDS = ("id", "name", "type", "repositories", "description", "observations", "relations")
+OBSERVATION_REQUIRED_FIELDS = ("id", "category", "description")
+RELATION_REQUIRED_FIELDS = ("id", "source", "target", "type", "description")
+
+# Allowed values are frozensets for O(1) lookups. Membership tests check for
+# str first: JSON lists/objects are unhashable and simply count as unknown.
 
 # Allowed system types
-ALLOWED_SYSTEM_TYPES = [
+ALLOWED_SYSTEM_TYPES = frozenset({
     "web-application", "mobile-application", "desktop-application",
     "api-service", "database", "message-broker", "cache", "cdn",
     "external-service", "user-facing", "internal-service",
     "data-store", "integration", "other"
-]
+})
 
 # Allowed observation categories
-OBSERVATION_CATEGORIES = [
+OBSERVATION_CATEGORIES = frozenset({
     "architectural", "technical", "quality", "security",
     "performance", "scalability", "maintainability", "integration",
     "deployment", "data", "testing", "documentation"
-]
+})
 
 # Allowed observation severities
-OBSERVATION_SEVERITIES = ["info", "warning", "critical"]
+OBSERVATION_SEVERITIES = frozenset({"info", "warning", "critical"})
 
 # Allowed relation types
-RELATION_TYPES = [
+RELATION_TYPES = frozenset({
     "http-rest", "http-graphql", "http-soap", "grpc", "websocket",
     "message-queue", "event-stream", "database-query", "database-write",
     "file-io", "dependency", "inheritance", "composition", "aggregation",
     "uses", "calls", "contains", "http", "https", "graphql", "rpc",
     "database-connection", "file-transfer", "authentication", "soap",
     "smtp", "external-api"
-]
+})
 
 
 def error(message: str, location: str = "", expected: str = "", actual: str = "") -> None:
@@ -69,6 +99,13 @@ def warning(message: str, recommendation: str = "") -> None:
     print("", file=sys.stderr)
 
 
+@lru_cache(maxsize=None)
+def load_parent(init_file_path: str) -> Dict[str, Any]:
+    """Read and decode init.json once per run; every c1-systems.json shares it."""
+    with open(init_file_path, 'rb') as f:
+        return json_loads(f.read())
+
+
 def validate_parent_reference(data: Dict[str, Any], init_file_path: str) -> Tuple[bool, List[str]]:
     """Validate parent file reference."""
     errors = []
@@ -81,8 +118,7 @@ def validate_parent_reference(data: Dict[str, Any], init_file_path: str) -> Tupl
 
     # Load parent file
     try:
-        with open(init_file_path, 'r') as f:
-            init_data = json.load(f)
+        init_data = load_parent(init_file_path)
     except Exception as e:
         errors.append(f"Failed to read parent file: {str(e)}")
         return False, errors
@@ -129,214 +165,316 @@ def validate_parent_reference(data: Dict[str, Any], init_file_path: str) -> Tupl
     return True, errors
 
 
-def validate_systems(systems: List[Dict[str, Any]], init_repos: List[str]) -> Tuple[bool, List[str], List[str]]:
-    """Validate systems array."""
-    errors = []
-    warnings = []
-    seen_ids = set()
-
-    if not systems:
-        errors.append("No systems found (systems array is empty)")
-        return False, errors, warnings
-
-    for idx, system in enumerate(systems):
-        if not isinstance(system, dict):
-            errors.append(f"System at index {idx} is not an object")
+def validate_system(
+    idx: int,
+    system: Dict[str, Any],
+    init_repos: AbstractSet[str],
+    seen_ids: Set[str],
+    errors: List[str],
+    warnings: List[str],
+) -> None:
+    """Validate one system's own fields."""
+    # Validate required fields
+    for field in SYSTEM_REQUIRED_FIELDS:
+        if field not in system:
+            errors.append(f"System at index {idx}: Missing required field '{field}'")
+
+    # Validate ID
+    if "id" in system:
+        system_id = system["id"]
+
+        # Check ID pattern
+        if not match_id(system_id):
+            errors.append(f"Invalid system ID format: {system_id} (must match ^[a-z0-9]+(-[a-z0-9]+)*$)")
+
+        # Check for duplicates
+        if system_id in seen_ids:
+            errors.append(f"Duplicate system ID: {system_id}")
+        seen_ids.add(system_id)
+
+    # Validate type
+    if "type" in system:
+        system_type = system["type"]
+        if not isinstance(system_type, str) or system_type not in ALLOWED_SYSTEM_TYPES:
+            warnings.append(f"Unknown system type: {system['type']} (system: {system.get('id', 'unknown')})")
+
+    # Validate repositories array
+    if "repositories" in system:
+        repos = system["repositories"]
+        if not isinstance(repos, list):
+            errors.append(f"System {system.get('id', idx)}: 'repositories' must be an array")
+        elif len(repos) == 0:
+            errors.append(f"System {system.get('id', idx)}: 'repositories' array is empty")
+        else:
+            # Check if repositories exist in init.json
+            for repo in repos:
+                if not isinstance(repo, str) or repo not in init_repos:
+                    warnings.append(f"System {system.get('id', idx)}: Repository '{repo}' not found in init.json")
+
+
+def validate_observations(system_id: Any, observations: Any, errors: List[str], warnings: List[str]) -> None:
+    """Validate the observations of one system."""
+    if not isinstance(observations, list):
+        errors.append(f"System {system_id}: 'observations' must be an array")
+        return
+
+    seen_obs_ids = set()
+
+    for idx, obs in enumerate(observations):
+        if not isinstance(obs, dict):
+            errors.append(f"System {system_id}: Observation at index {idx} is not an object")
             continue
 
         # Validate required fields
-        required_fields = ["id", "name", "type", "repositories", "description", "observations", "relations"]
-        for field in required_fields:
-            if field not in system:
-                errors.append(f"System at index {idx}: Missing required field '{field}'")
-
-        # Validate ID
-        if "id" in system:
-            system_id = system["id"]
-
-            # Check ID pattern
-            if not ID_PATTERN.match(system_id):
-                errors.append(f"Invalid system ID format: {system_id} (must match ^[a-z0-9]+(-[a-z0-9]+)*$)")
-
-            # Check for duplicates
-            if system_id in seen_ids:
-                errors.append(f"Duplicate system ID: {system_id}")
-            seen_ids.add(system_id)
-
-        # Validate type
-        if "type" in system:
-            if system["type"] not in ALLOWED_SYSTEM_TYPES:
-                warnings.append(f"Unknown system type: {system['type']} (system: {system.get('id', 'unknown')})")
-
-        # Validate repositories array
-        if "repositories" in system:
-            repos = system["repositories"]
-            if not isinstance(repos, list):
-                errors.append(f"System {system.get('id', idx)}: 'repositories' must be an array")
-            elif len(repos) == 0:
-                errors.append(f"System {system.get('id', idx)}: 'repositories' array is empty")
-            else:
-                # Check if repositories exist in init.json
-                for repo in repos:
-                    if repo not in init_repos:
-                        warnings.append(f"System {system.get('id', idx)}: Repository '{repo}' not found in init.json")
-
-    return len(errors) == 0, errors, warnings
-
-
-def validate_observations(systems: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate observations in all systems."""
-    errors = []
-    warnings = []
-
-    for system in systems:
-        if not isinstance(system, dict):
+        for field in OBSERVATION_REQUIRED_FIELDS:
+            if field not in obs:
+                errors.append(f"System {system_id}: Observation at index {idx} missing '{field}'")
+
+        # Validate ID uniqueness within system
+        if "id" in obs:
+            obs_id = obs["id"]
+            if obs_id in seen_obs_ids:
+                errors.append(f"System {system_id}: Duplicate observation ID: {obs_id}")
+            seen_obs_ids.add(obs_id)
+
+        # Validate category
+        if "category" in obs:
+            category = obs["category"]
+            if not isinstance(category, str) or category not in OBSERVATION_CATEGORIES:
+                warnings.append(f"System {system_id}: Unknown observation category: {obs['category']}")
+
+        # Validate severity
+        if "severity" in obs:
+            severity = obs["severity"]
+            if not isinstance(severity, str) or severity not in OBSERVATION_SEVERITIES:
+                errors.append(f"System {system_id}: Invalid severity: {obs['severity']}")
+
+        # Validate description length
+        if "description" in obs:
+            if len(obs["description"]) < 10:
+                warnings.append(f"System {system_id}: Observation '{obs.get('id', idx)}' has short description (< 10 chars)")
+
+
+def find_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Find one cycle in every strongly connected component of graph.
+
+    Uses an iterative Tarjan's algorithm, so every node and edge is visited
+    once and deep graphs cannot hit the recursion limit. A component has a
+    cycle if it has more than one node or a self-loop; each cycle is returned
+    as a path that starts and ends on its earliest node in graph order.
+    """
+    # Documents without relations between known systems have nothing to walk
+    if not any(graph.values()):
+        return []
+
+    nodes = list(graph)
+    position = {node: i for i, node in enumerate(nodes)}
+    adjacency = [[position[target] for target in graph[node]] for node in nodes]
+
+    index = [-1] * len(nodes)
+    lowlink = [0] * len(nodes)
+    on_stack = [False] * len(nodes)
+    scc_stack: List[int] = []
+    cycles: List[List[int]] = []
+    counter = 0
+
+    for root in range(len(nodes)):
+        if index[root] != -1:
             continue
 
-        system_id = system.get("id", "unknown")
-        observations = system.get("observations", [])
-
-        if not isinstance(observations, list):
-            errors.append(f"System {system_id}: 'observations' must be an array")
-            continue
-
-        seen_obs_ids = set()
-
-        for idx, obs in enumerate(observations):
-            if not isinstance(obs, dict):
-                errors.append(f"System {system_id}: Observation at index {idx} is not an object")
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+
+        while work:
+            node, next_edge = work[-1]
+            edges = adjacency[node]
+
+            if next_edge < len(edges):
+                work[-1] = (node, next_edge + 1)
+                neighbor = edges[next_edge]
+                if index[neighbor] == -1:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    scc_stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append((neighbor, 0))
+                elif on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
                 continue
 
-            # Validate required fields
-            required_fields = ["id", "category", "description"]
-            for field in required_fields:
-                if field not in obs:
-                    errors.append(f"System {system_id}: Observation at index {idx} missing '{field}'")
-
-            # Validate ID uniqueness within system
-            if "id" in obs:
-                obs_id = obs["id"]
-                if obs_id in seen_obs_ids:
-                    errors.append(f"System {system_id}: Duplicate observation ID: {obs_id}")
-                seen_obs_ids.add(obs_id)
-
-            # Validate category
-            if "category" in obs:
-                if obs["category"] not in OBSERVATION_CATEGORIES:
-                    warnings.append(f"System {system_id}: Unknown observation category: {obs['category']}")
-
-            # Validate severity
-            if "severity" in obs:
-                if obs["severity"] not in OBSERVATION_SEVERITIES:
-                    errors.append(f"System {system_id}: Invalid severity: {obs['severity']}")
+            # All edges done: propagate lowlink and pop a finished component
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+
+            if lowlink[node] == index[node]:
+                component = set()
+                while True:
+                    member = scc_stack.pop()
+                    on_stack[member] = False
+                    component.add(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in adjacency[node]:
+                    cycles.append(cycle_within(min(component), component, adjacency))
+
+    cycles.sort(key=lambda cycle: cycle[0])
+    return [[nodes[i] for i in cycle] for cycle in cycles]
+
+
+def cycle_within(start: int, component: Set[int], adjacency: List[List[int]]) -> List[int]:
+    """
+    Shortest path from start back to itself using only nodes of its component.
+
+    A self-loop on start only counts when it is the whole component: it is
+    already reported as a self-referencing relation, and would otherwise hide
+    the cycle through the other systems.
+    """
+    previous = {start: start}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in adjacency[node]:
+            if neighbor == start:
+                if node == start and len(component) > 1:
+                    continue
+                path = [node]
+                while path[-1] != start:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if neighbor in component and neighbor not in previous:
+                previous[neighbor] = node
+                queue.append(neighbor)
+    return [start, start]  # unreachable for a cyclic component
+
+
+def validate_relations(
+    system_id: Any,
+    relations: Any,
+    graph: Dict[str, List[str]],
+    errors: List[str],
+    warnings: List[str],
+) -> None:
+    """Validate the relations of one system and add its edges to graph."""
+    if not isinstance(relations, list):
+        errors.append(f"System {system_id}: 'relations' must be an array")
+        return
+
+    seen_rel_ids = set()
+
+    for idx, rel in enumerate(relations):
+        if not isinstance(rel, dict):
+            errors.append(f"System {system_id}: Relation at index {idx} is not an object")
+            continue
 
-            # Validate description length
-            if "description" in obs:
-                if len(obs["description"]) < 10:
-                    warnings.append(f"System {system_id}: Observation '{obs.get('id', idx)}' has short description (< 10 chars)")
+        # Validate required fields
+        for field in RELATION_REQUIRED_FIELDS:
+            if field not in rel:
+                errors.append(f"System {system_id}: Relation at index {idx} missing '{field}'")
 
-    return len(errors) == 0, errors, warnings
+        # Validate ID uniqueness within system
+        if "id" in rel:
+            rel_id = rel["id"]
+            if rel_id in seen_rel_ids:
+                errors.append(f"System {system_id}: Duplicate relation ID: {rel_id}")
+            seen_rel_ids.add(rel_id)
 
+        # Validate type
+        if "type" in rel:
+            rel_type = rel["type"]
+            if not isinstance(rel_type, str) or rel_type not in RELATION_TYPES:
+                warnings.append(f"System {system_id}: Unknown relation type: {rel['type']}")
+
+        # Validate source and target
+        source = rel.get("source")
+        target = rel.get("target")
+
+        if source and target:
+            # Check for self-references
+            if source == target:
+                warnings.append(f"System {system_id}: Self-referencing relation: {rel.get('id', idx)}")
+
+            # Check if source and target exist (graph has a node for every system ID)
+            if source not in graph:
+                warnings.append(f"System {system_id}: Relation source not found: {source}")
+            if target not in graph:
+                warnings.append(f"System {system_id}: Relation target not found: {target}")
+
+            # Build graph for circular dependency detection
+            if source in graph and target in graph:
+                graph[source].append(target)
+
+        # Validate description length
+        if "description" in rel:
+            if len(rel["description"]) < 10:
+                warnings.append(f"System {system_id}: Relation '{rel.get('id', idx)}' has short description (< 10 chars)")
+
+
+def validate_all(
+    systems: List[Dict[str, Any]],
+    init_repos: AbstractSet[str],
+) -> Tuple[Dict[str, Tuple[List[str], List[str]]], List[Tuple[str, str]]]:
+    """
+    Validate systems, observations and relations in a single pass over systems.
+
+    Returns (errors, warnings) per section - "systems", "observations" and
+    "relations", in that order - plus (message, recommendation) notices for
+    systems without observations or relations.
+    """
+    sections = {"systems": ([], []), "observations": ([], []), "relations": ([], [])}
+    sys_errors, sys_warnings = sections["systems"]
+    obs_errors, obs_warnings = sections["observations"]
+    rel_errors, rel_warnings = sections["relations"]
+    notices: List[Tuple[str, str]] = []
 
-def validate_relations(systems: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate relations and graph validity."""
-    errors = []
-    warnings = []
+    if not systems:
+        sys_errors.append("No systems found (systems array is empty)")
+        return sections, notices
 
-    # Collect all system IDs for reference validation
-    system_ids = {sys.get("id") for sys in systems if isinstance(sys, dict) and "id" in sys}
+    # Relations may point at systems defined later, so every ID is collected
+    # up front; the keys double as graph nodes for cycle detection (in
+    # document order)
+    graph = {system["id"]: [] for system in systems if isinstance(system, dict) and "id" in system}
+    seen_ids: Set[str] = set()
 
-    # Build adjacency list for circular dependency detection
-    graph = {sys_id: [] for sys_id in system_ids}
+    for idx, system in enumerate(systems):
+        if FAIL_FAST and (sys_errors or obs_errors or rel_errors):
+            return sections, notices
 
-    for system in systems:
         if not isinstance(system, dict):
+            sys_errors.append(f"System at index {idx} is not an object")
             continue
 
+        validate_system(idx, system, init_repos, seen_ids, sys_errors, sys_warnings)
+
         system_id = system.get("id", "unknown")
+        observations = system.get("observations", [])
         relations = system.get("relations", [])
+        validate_observations(system_id, observations, obs_errors, obs_warnings)
+        validate_relations(system_id, relations, graph, rel_errors, rel_warnings)
 
-        if not isinstance(relations, list):
-            errors.append(f"System {system_id}: 'relations' must be an array")
-            continue
-
-        seen_rel_ids = set()
+        # Check for empty observations/relations (warning)
+        if not observations:
+            notices.append((f"System {system_id}: No observations",
+                            "Add observations to document system characteristics"))
+        if not relations:
+            notices.append((f"System {system_id}: No relations",
+                            "Add relations to document system dependencies"))
 
-        for idx, rel in enumerate(relations):
-            if not isinstance(rel, dict):
-                errors.append(f"System {system_id}: Relation at index {idx} is not an object")
-                continue
+    # Detect circular dependencies: one warning per strongly connected component
+    for cycle in find_cycles(graph):
+        cycle_str = " → ".join(cycle)
+        rel_warnings.append(f"Circular dependency detected: {cycle_str}")
 
-            # Validate required fields
-            required_fields = ["id", "source", "target", "type", "description"]
-            for field in required_fields:
-                if field not in rel:
-                    errors.append(f"System {system_id}: Relation at index {idx} missing '{field}'")
-
-            # Validate ID uniqueness within system
-            if "id" in rel:
-                rel_id = rel["id"]
-                if rel_id in seen_rel_ids:
-                    errors.append(f"System {system_id}: Duplicate relation ID: {rel_id}")
-                seen_rel_ids.add(rel_id)
-
-            # Validate type
-            if "type" in rel:
-                if rel["type"] not in RELATION_TYPES:
-                    warnings.append(f"System {system_id}: Unknown relation type: {rel['type']}")
-
-            # Validate source and target
-            source = rel.get("source")
-            target = rel.get("target")
-
-            if source and target:
-                # Check for self-references
-                if source == target:
-                    warnings.append(f"System {system_id}: Self-referencing relation: {rel.get('id', idx)}")
-
-                # Check if source and target exist
-                if source not in system_ids:
-                    warnings.append(f"System {system_id}: Relation source not found: {source}")
-                if target not in system_ids:
-                    warnings.append(f"System {system_id}: Relation target not found: {target}")
-
-                # Build graph for circular dependency detection
-                if source in graph and target in system_ids:
-                    graph[source].append(target)
-
-            # Validate description length
-            if "description" in rel:
-                if len(rel["description"]) < 10:
-                    warnings.append(f"System {system_id}: Relation '{rel.get('id', idx)}' has short description (< 10 chars)")
-
-    # Detect circular dependencies using DFS
-    def has_cycle(node: str, visited: Set[str], rec_stack: Set[str], path: List[str]) -> Tuple[bool, List[str]]:
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                has_cycle_result, cycle_path = has_cycle(neighbor, visited, rec_stack, path.copy())
-                if has_cycle_result:
-                    return True, cycle_path
-            elif neighbor in rec_stack:
-                # Found cycle
-                cycle_start = path.index(neighbor)
-                return True, path[cycle_start:] + [neighbor]
-
-        rec_stack.remove(node)
-        return False, []
-
-    visited = set()
-    for node in graph:
-        if node not in visited:
-            has_cycle_result, cycle_path = has_cycle(node, visited, set(), [])
-            if has_cycle_result:
-                cycle_str = " → ".join(cycle_path)
-                warnings.append(f"Circular dependency detected: {cycle_str}")
-
-    return len(errors) == 0, errors, warnings
+    return sections, notices
 
 
 def main() -> int:
@@ -354,8 +492,8 @@ def main() -> int:
     for filepath in c1_files:
         print(f"[VALIDATE-C1] Validating {filepath}...", file=sys.stderr)
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = json_loads(f.read())
         except json.JSONDecodeError as e:
             error(f"Invalid JSON in {filepath}", actual=str(e))
             return 2
@@ -373,6 +511,41 @@ def main() -> int:
     return 0 if all_valid else 1
 
 
+def daemon() -> int:
+    """Validate newline-delimited c1-systems.json documents read from stdin."""
+    for lineno, line in enumerate(sys.stdin.buffer, 1):
+        if not line.strip():
+            continue
+
+        source = f"<stdin:{lineno}>"
+        print(f"[VALIDATE-C1] Validating {source}...", file=sys.stderr)
+        try:
+            data = json_loads(line)
+        except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError for non-UTF-8 bytes
+            error(f"Invalid JSON in {source}", actual=str(e))
+            result = 2
+        else:
+            if isinstance(data, dict):
+                # init.json may change between documents, so re-read it for each
+                load_parent.cache_clear()
+                try:
+                    result = validate_file(data, source)
+                except Exception as e:
+                    # A document of an unexpected shape must not stop the daemon
+                    error(f"Failed to validate {source}: {str(e)}")
+                    result = 2
+            else:
+                error(f"Document in {source} is not an object")
+                result = 2
+
+        # The caller waits for this line before sending the next document
+        sys.stderr.flush()
+        sys.stdout.write(f"{result}\n")
+        sys.stdout.flush()
+
+    return 0
+
+
 def validate_file(data: Dict[str, Any], filepath: str) -> int:
     """Validate a single c1-systems.json file."""
 
@@ -394,61 +567,35 @@ def validate_file(data: Dict[str, Any], filepath: str) -> int:
             error(err) if not err.startswith("RECOMMENDATION:") else warning(err.replace("RECOMMENDATION: ", ""))
         return 2
 
-    # Load init.json to get repository names
-    init_repos = []
+    # Get repository names from init.json (already loaded and cached above) as
+    # a set, since every repository of every system is looked up in it
+    init_repos: AbstractSet[str] = frozenset()
     try:
-        with open(init_file_path, 'r') as f:
-            init_data = json.load(f)
-            init_repos = [repo.get("name", repo.get("path", ""))
-                         for repo in init_data.get("repositories", [])]
+        init_data = load_parent(init_file_path)
+        names = (repo.get("name", repo.get("path", "")) for repo in init_data.get("repositories", []))
+        init_repos = frozenset(name for name in names if isinstance(name, str))
     except (OSError, json.JSONDecodeError):
         # Silent failure is acceptable here - we already validated parent file exists above
         # If we can't load it, validation will continue with empty repo list (may trigger warnings)
         pass
 
-    # 2. Validate systems
+    # 2.-4. Validate systems, observations and relations (one pass)
     systems = data.get("systems", [])
-    valid, errors, warns = validate_systems(systems, init_repos)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="systems")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 3. Validate observations
-    valid, errors, warns = validate_observations(systems)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="observations")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 4. Validate relations
-    valid, errors, warns = validate_relations(systems)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="relations")
-    for warn in warns:
+    sections, notices = validate_all(systems, init_repos)
+    for location, (errors, warns) in sections.items():
+        if errors:
+            has_errors = True
+            for err in errors:
+                error(err, location=location)
+        # Identical warnings (e.g. one unknown category on many observations
+        # of a system) are reported once, in first-seen order, with a count
+        for warn, count in Counter(warns).items():
+            has_warnings = True
+            warning(warn if count == 1 else f"{warn} (×{count})")
+
+    for message, recommendation in notices:
         has_warnings = True
-        warning(warn)
-
-    # Check for empty observations/relations (warning)
-    for system in systems:
-        if isinstance(system, dict):
-            system_id = system.get("id", "unknown")
-            if not system.get("observations", []):
-                has_warnings = True
-                warning(f"System {system_id}: No observations",
-                       recommendation="Add observations to document system characteristics")
-            if not system.get("relations", []):
-                has_warnings = True
-                warning(f"System {system_id}: No relations",
-                       recommendation="Add relations to document system dependencies")
+        warning(message, recommendation=recommendation)
 
     # Return appropriate exit code
     if has_errors:
@@ -463,4 +610,4 @@ def validate_file(data: Dict[str, Any], filepath: str) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(daemon() if "--daemon" in sys.argv[1:] else main())
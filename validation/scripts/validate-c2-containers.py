@@ -6,6 +6,13 @@ Exit codes:
   0 - Validation passed
   1 - Non-blocking warning (continue with user notification)
   2 - Blocking error (halt workflow immediately)
+
+Environment:
+  MELLY_MAX_ERRORS - if set to a positive number, stop checking a file once
+                     that many errors have been found (reports stay short on
+                     badly broken input; the exit code is 2 either way). The
+                     container that reaches the limit is still reported in
+                     full, so a report may hold a few more errors
 """
 
 import sys
@@ -14,61 +21,109 @@ import os
 import re
 import glob
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Set
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Any, Set
+
+try:
+    # orjson is an optional, much faster drop-in for decoding the input files
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # ijson is optional; with it, very large inputs are validated container by
+    # container instead of being loaded whole
+    import ijson
+except ImportError:
+    ijson = None
+
+# Inputs at least this large are streamed when ijson is available
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Exceptions raised for malformed input, by either the loader or the streamer
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+def env_limit(name: str) -> int:
+    """Read a non-negative count from the environment (0 when unset or not a number)."""
+    value = os.environ.get(name, "").strip()
+    return int(value) if value.isdigit() else 0
+
 
+# Stop checking a file after this many errors (0 = report everything)
+MAX_ERRORS = env_limit("MELLY_MAX_ERRORS")
 
-# ID pattern
-ID_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+# ID pattern (always applied with fullmatch, so no anchors are needed)
+ID_PATTERN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+match_id = ID_PATTERN.fullmatch
+
+# Allowed values are frozensets for O(1) lookups. Membership tests check for
+# str first: JSON lists/objects are unhashable and simply count as unknown.
 
 # Allowed container types
-ALLOWED_CONTAINER_TYPES = [
+ALLOWED_CONTAINER_TYPES = frozenset({
     "web-server", "app-server", "database", "cache", "message-broker",
     "spa", "api", "worker", "file-storage", "web-application", "application-server",
     "spa-client", "mobile-app", "desktop-app"
-]
+})
 
 # Allowed environments
-ALLOWED_ENVIRONMENTS = ["browser", "server", "cloud", "edge", "mobile"]
+ALLOWED_ENVIRONMENTS = frozenset({"browser", "server", "cloud", "edge", "mobile"})
 
 # Observation and relation categories (same as C1)
-OBSERVATION_CATEGORIES = [
+OBSERVATION_CATEGORIES = frozenset({
     "architectural", "technical", "quality", "security",
     "performance", "scalability", "maintainability", "integration",
     "deployment", "data", "testing", "documentation", "technology",
     "runtime", "communication", "data-storage", "authentication",
     "configuration", "monitoring", "dependencies"
-]
+})
 
-OBSERVATION_SEVERITIES = ["info", "warning", "critical"]
+OBSERVATION_SEVERITIES = frozenset({"info", "warning", "critical"})
 
-RELATION_TYPES = [
+RELATION_TYPES = frozenset({
     "http-rest", "http-graphql", "grpc", "websocket",
     "database-connection", "database-query", "database-write", "database-read-write",
     "cache-access", "cache-read", "cache-write", "cache-read-write",
     "message-publish", "message-subscribe", "message-consumer",
     "file-read", "file-write", "cdn-fetch", "stream",
     "dependency", "uses", "calls", "contains"
-]
+})
 
 
 def error(message: str, location: str = "", expected: str = "", actual: str = "") -> None:
-    """Print formatted error message to stderr."""
-    print(f"[VALIDATE-C2] ERROR: {message}", file=sys.stderr)
+    """Print formatted error message to stderr (in a single write)."""
+    lines = [f"[VALIDATE-C2] ERROR: {message}\n"]
     if location:
-        print(f"  Location: {location}", file=sys.stderr)
+        lines.append(f"  Location: {location}\n")
     if expected:
-        print(f"  Expected: {expected}", file=sys.stderr)
+        lines.append(f"  Expected: {expected}\n")
     if actual:
-        print(f"  Actual: {actual}", file=sys.stderr)
-    print("", file=sys.stderr)
+        lines.append(f"  Actual: {actual}\n")
+    lines.append("\n")
+    sys.stderr.write("".join(lines))
 
 
 def warning(message: str, recommendation: str = "") -> None:
-    """Print formatted warning message to stderr."""
-    print(f"[VALIDATE-C2] WARNING: {message}", file=sys.stderr)
+    """Print formatted warning message to stderr (in a single write)."""
     if recommendation:
-        print(f"  Recommendation: {recommendation}", file=sys.stderr)
-    print("", file=sys.stderr)
+        sys.stderr.write(f"[VALIDATE-C2] WARNING: {message}\n  Recommendation: {recommendation}\n\n")
+    else:
+        sys.stderr.write(f"[VALIDATE-C2] WARNING: {message}\n\n")
+
+
+@lru_cache(maxsize=None)
+def load_parent(c1_file_path: str) -> Dict[str, Any]:
+    """Read and decode c1-systems.json once per run; every c2-containers.json shares it."""
+    with open(c1_file_path, 'rb') as f:
+        return json_loads(f.read())
+
+
+@lru_cache(maxsize=None)
+def format_system_ids(system_ids: FrozenSet[str]) -> str:
+    """Sorted, comma-separated system IDs, built once however many containers miss a system."""
+    return ', '.join(sorted(system_ids))
 
 
 def validate_parent_reference(data: Dict[str, Any], c1_file_path: str) -> Tuple[bool, List[str], str]:
@@ -83,8 +138,7 @@ def validate_parent_reference(data: Dict[str, Any], c1_file_path: str) -> Tuple[
 
     # Load parent file
     try:
-        with open(c1_file_path, 'r') as f:
-            c1_data = json.load(f)
+        c1_data = load_parent(c1_file_path)
     except Exception as e:
         errors.append(f"Failed to read parent file: {str(e)}")
         return False, errors, ""
@@ -120,186 +174,248 @@ def validate_parent_reference(data: Dict[str, Any], c1_file_path: str) -> Tuple[
     return True, errors, parent_timestamp_str
 
 
-def validate_containers(containers: List[Dict[str, Any]], c1_system_ids: Set[str]) -> Tuple[bool, List[str], List[str]]:
-    """Validate containers array."""
-    errors = []
-    warnings = []
-    seen_ids = set()
-
-    if not containers:
-        errors.append("No containers found (containers array is empty)")
-        return False, errors, warnings
-
-    for idx, container in enumerate(containers):
-        if not isinstance(container, dict):
-            errors.append(f"Container at index {idx} is not an object")
+def validate_container(
+    idx: int,
+    container: Dict[str, Any],
+    c1_system_ids: FrozenSet[str],
+    seen_ids: Set[str],
+    errors: List[str],
+    warnings: List[str],
+) -> None:
+    """Validate one container's own fields."""
+    # How messages below refer to this container
+    cid = container.get("id", idx)
+
+    # Validate required fields
+    required_fields = ["id", "name", "type", "system_id", "responsibility", "technology", "runtime"]
+    for field in required_fields:
+        if field not in container:
+            errors.append(f"Container at index {idx}: Missing required field '{field}'")
+
+    # Validate ID
+    if "id" in container:
+        container_id = container["id"]
+
+        # Check ID pattern
+        if not match_id(container_id):
+            errors.append(f"Invalid container ID format: {container_id}")
+
+        # Check for duplicates
+        if container_id in seen_ids:
+            errors.append(f"Duplicate container ID: {container_id}")
+        seen_ids.add(container_id)
+
+    # Validate type
+    if "type" in container:
+        container_type = container["type"]
+        if not isinstance(container_type, str) or container_type not in ALLOWED_CONTAINER_TYPES:
+            warnings.append(f"Unknown container type: {container['type']} (container: {container.get('id', 'unknown')})")
+
+    # Validate system_id (must reference valid C1 system)
+    if "system_id" in container:
+        system_id = container["system_id"]
+        if system_id not in c1_system_ids:
+            errors.append(f"Container {cid}: System not found: {system_id}")
+            errors.append(f"  Available systems: {format_system_ids(c1_system_ids)}")
+
+    # Validate technology
+    if "technology" in container:
+        tech = container["technology"]
+        if not isinstance(tech, dict):
+            errors.append(f"Container {cid}: 'technology' must be an object")
+        else:
+            if "primary_language" not in tech:
+                errors.append(f"Container {cid}: Missing 'technology.primary_language'")
+            if "framework" not in tech:
+                errors.append(f"Container {cid}: Missing 'technology.framework'")
+
+    # Validate runtime
+    if "runtime" in container:
+        runtime = container["runtime"]
+        if not isinstance(runtime, dict):
+            errors.append(f"Container {cid}: 'runtime' must be an object")
+        else:
+            if "environment" not in runtime:
+                errors.append(f"Container {cid}: Missing 'runtime.environment'")
+            elif not isinstance(runtime["environment"], str) or runtime["environment"] not in ALLOWED_ENVIRONMENTS:
+                warnings.append(f"Container {cid}: Unknown environment: {runtime['environment']}")
+
+            if "platform" not in runtime:
+                errors.append(f"Container {cid}: Missing 'runtime.platform'")
+
+            if "containerized" not in runtime:
+                errors.append(f"Container {cid}: Missing 'runtime.containerized'")
+            elif runtime["containerized"] and "container_technology" not in runtime:
+                errors.append(f"Container {cid}: Missing 'runtime.container_technology' (required when containerized=true)")
+
+
+def validate_observations(container_id: Any, observations: Any, errors: List[str], warnings: List[str]) -> None:
+    """Validate the observations of one container."""
+    if not isinstance(observations, list):
+        errors.append(f"Container {container_id}: 'observations' must be an array")
+        return
+
+    seen_obs_ids = set()
+
+    for idx, obs in enumerate(observations):
+        if not isinstance(obs, dict):
+            errors.append(f"Container {container_id}: Observation at index {idx} is not an object")
             continue
 
         # Validate required fields
-        required_fields = ["id", "name", "type", "system_id", "responsibility", "technology", "runtime"]
+        required_fields = ["id", "category", "description"]
         for field in required_fields:
-            if field not in container:
-                errors.append(f"Container at index {idx}: Missing required field '{field}'")
-
-        # Validate ID
-        if "id" in container:
-            container_id = container["id"]
-
-            # Check ID pattern
-            if not ID_PATTERN.match(container_id):
-                errors.append(f"Invalid container ID format: {container_id}")
+            if field not in obs:
+                errors.append(f"Container {container_id}: Observation at index {idx} missing '{field}'")
+
+        # Validate ID uniqueness
+        if "id" in obs:
+            obs_id = obs["id"]
+            if obs_id in seen_obs_ids:
+                errors.append(f"Container {container_id}: Duplicate observation ID: {obs_id}")
+            seen_obs_ids.add(obs_id)
+
+        # Validate category
+        if "category" in obs:
+            category = obs["category"]
+            if not isinstance(category, str) or category not in OBSERVATION_CATEGORIES:
+                warnings.append(f"Container {container_id}: Unknown observation category: {obs['category']}")
+
+        # Validate severity
+        if "severity" in obs:
+            severity = obs["severity"]
+            if not isinstance(severity, str) or severity not in OBSERVATION_SEVERITIES:
+                errors.append(f"Container {container_id}: Invalid severity: {obs['severity']}")
+
+        # Validate description length
+        if "description" in obs:
+            if len(obs["description"]) < 10:
+                warnings.append(f"Container {container_id}: Observation '{obs.get('id', idx)}' has short description")
+
+
+def validate_relations(
+    container_id: Any,
+    relations: Any,
+    container_ids: Set[str],
+    errors: List[str],
+    warnings: List[str],
+) -> None:
+    """Validate the relations of one container (container_ids: every container ID in the file)."""
+    if not isinstance(relations, list):
+        errors.append(f"Container {container_id}: 'relations' must be an array")
+        return
+
+    for idx, rel in enumerate(relations):
+        if not isinstance(rel, dict):
+            errors.append(f"Container {container_id}: Relation at index {idx} is not an object")
+            continue
 
-            # Check for duplicates
-            if container_id in seen_ids:
-                errors.append(f"Duplicate container ID: {container_id}")
-            seen_ids.add(container_id)
+        # Validate required fields
+        required_fields = ["target", "type", "description"]
+        for field in required_fields:
+            if field not in rel:
+                errors.append(f"Container {container_id}: Relation at index {idx} missing '{field}'")
 
         # Validate type
-        if "type" in container:
-            if container["type"] not in ALLOWED_CONTAINER_TYPES:
-                warnings.append(f"Unknown container type: {container['type']} (container: {container.get('id', 'unknown')})")
-
-        # Validate system_id (must reference valid C1 system)
-        if "system_id" in container:
-            system_id = container["system_id"]
-            if system_id not in c1_system_ids:
-                errors.append(f"Container {container.get('id', idx)}: System not found: {system_id}")
-                errors.append(f"  Available systems: {', '.join(sorted(c1_system_ids))}")
-
-        # Validate technology
-        if "technology" in container:
-            tech = container["technology"]
-            if not isinstance(tech, dict):
-                errors.append(f"Container {container.get('id', idx)}: 'technology' must be an object")
-            else:
-                if "primary_language" not in tech:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'technology.primary_language'")
-                if "framework" not in tech:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'technology.framework'")
-
-        # Validate runtime
-        if "runtime" in container:
-            runtime = container["runtime"]
-            if not isinstance(runtime, dict):
-                errors.append(f"Container {container.get('id', idx)}: 'runtime' must be an object")
-            else:
-                if "environment" not in runtime:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'runtime.environment'")
-                elif runtime["environment"] not in ALLOWED_ENVIRONMENTS:
-                    warnings.append(f"Container {container.get('id', idx)}: Unknown environment: {runtime['environment']}")
-
-                if "platform" not in runtime:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'runtime.platform'")
+        if "type" in rel:
+            rel_type = rel["type"]
+            if not isinstance(rel_type, str) or rel_type not in RELATION_TYPES:
+                warnings.append(f"Container {container_id}: Unknown relation type: {rel['type']}")
+
+        # Validate target
+        if "target" in rel:
+            target = rel["target"]
+            if target not in container_ids:
+                warnings.append(f"Container {container_id}: Relation target not found: {target}")
+
+        # Validate description length
+        if "description" in rel:
+            if len(rel["description"]) < 10:
+                warnings.append(f"Container {container_id}: Relation has short description")
+
+
+def validate_all(
+    containers: Iterable[Dict[str, Any]],
+    c1_system_ids: FrozenSet[str],
+    container_ids: Optional[Set[str]] = None,
+) -> Tuple[Dict[str, Tuple[List[str], List[str]]], Optional[Set[str]]]:
+    """
+    Validate containers, observations and relations in a single pass over containers.
+
+    Returns (errors, warnings) per section - "containers", "observations" and
+    "relations", in that order - plus the IDs of the systems that have at
+    least one container, or None if MAX_ERRORS stopped the pass early.
+    container_ids is collected from containers unless given (a streamed,
+    non-empty iterator must come with it).
+    """
+    sections = {"containers": ([], []), "observations": ([], []), "relations": ([], [])}
+    con_errors, con_warnings = sections["containers"]
+    obs_errors, obs_warnings = sections["observations"]
+    rel_errors, rel_warnings = sections["relations"]
+    systems_with_containers: Set[str] = set()
 
-                if "containerized" not in runtime:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'runtime.containerized'")
-                elif runtime["containerized"] and "container_technology" not in runtime:
-                    errors.append(f"Container {container.get('id', idx)}: Missing 'runtime.container_technology' (required when containerized=true)")
-
-    return len(errors) == 0, errors, warnings
+    if not containers:
+        con_errors.append("No containers found (containers array is empty)")
+        return sections, systems_with_containers
 
+    # Relations may point at containers defined later, so every ID is
+    # collected up front
+    if container_ids is None:
+        container_ids = {c.get("id") for c in containers if isinstance(c, dict) and "id" in c}
+    seen_ids: Set[str] = set()
 
-def validate_observations(containers: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate observations in all containers."""
-    errors = []
-    warnings = []
+    for idx, container in enumerate(containers):
+        if MAX_ERRORS and len(con_errors) + len(obs_errors) + len(rel_errors) >= MAX_ERRORS:
+            return sections, None
 
-    for container in containers:
         if not isinstance(container, dict):
+            con_errors.append(f"Container at index {idx} is not an object")
             continue
 
-        container_id = container.get("id", "unknown")
-        observations = container.get("observations", [])
-
-        if not isinstance(observations, list):
-            errors.append(f"Container {container_id}: 'observations' must be an array")
-            continue
-
-        seen_obs_ids = set()
-
-        for idx, obs in enumerate(observations):
-            if not isinstance(obs, dict):
-                errors.append(f"Container {container_id}: Observation at index {idx} is not an object")
-                continue
-
-            # Validate required fields
-            required_fields = ["id", "category", "description"]
-            for field in required_fields:
-                if field not in obs:
-                    errors.append(f"Container {container_id}: Observation at index {idx} missing '{field}'")
-
-            # Validate ID uniqueness
-            if "id" in obs:
-                obs_id = obs["id"]
-                if obs_id in seen_obs_ids:
-                    errors.append(f"Container {container_id}: Duplicate observation ID: {obs_id}")
-                seen_obs_ids.add(obs_id)
-
-            # Validate category
-            if "category" in obs:
-                if obs["category"] not in OBSERVATION_CATEGORIES:
-                    warnings.append(f"Container {container_id}: Unknown observation category: {obs['category']}")
+        validate_container(idx, container, c1_system_ids, seen_ids, con_errors, con_warnings)
 
-            # Validate severity
-            if "severity" in obs:
-                if obs["severity"] not in OBSERVATION_SEVERITIES:
-                    errors.append(f"Container {container_id}: Invalid severity: {obs['severity']}")
-
-            # Validate description length
-            if "description" in obs:
-                if len(obs["description"]) < 10:
-                    warnings.append(f"Container {container_id}: Observation '{obs.get('id', idx)}' has short description")
-
-    return len(errors) == 0, errors, warnings
-
-
-def validate_relations(containers: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate relations between containers."""
-    errors = []
-    warnings = []
-
-    # Collect all container IDs
-    container_ids = {c.get("id") for c in containers if isinstance(c, dict) and "id" in c}
+        # Both are optional; a missing array has nothing to check
+        container_id = container.get("id", "unknown")
+        if "observations" in container:
+            validate_observations(container_id, container["observations"], obs_errors, obs_warnings)
+        if "relations" in container:
+            validate_relations(container_id, container["relations"], container_ids, rel_errors, rel_warnings)
 
-    for container in containers:
-        if not isinstance(container, dict):
-            continue
+        system_id = container.get("system_id")
+        if system_id:
+            systems_with_containers.add(system_id)
 
-        container_id = container.get("id", "unknown")
-        relations = container.get("relations", [])
+    return sections, systems_with_containers
 
-        if not isinstance(relations, list):
-            errors.append(f"Container {container_id}: 'relations' must be an array")
-            continue
 
-        for idx, rel in enumerate(relations):
-            if not isinstance(rel, dict):
-                errors.append(f"Container {container_id}: Relation at index {idx} is not an object")
-                continue
+def stream_items(filepath: str, prefix: str) -> Iterator[Any]:
+    """Yield the values at prefix in filepath as ijson parses them."""
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
 
-            # Validate required fields
-            required_fields = ["target", "type", "description"]
-            for field in required_fields:
-                if field not in rel:
-                    errors.append(f"Container {container_id}: Relation at index {idx} missing '{field}'")
 
-            # Validate type
-            if "type" in rel:
-                if rel["type"] not in RELATION_TYPES:
-                    warnings.append(f"Container {container_id}: Unknown relation type: {rel['type']}")
+def stream_file(filepath: str) -> Tuple[Dict[str, Any], Iterable[Dict[str, Any]], Set[str]]:
+    """
+    Read a large c2-containers.json without loading it whole.
 
-            # Validate target
-            if "target" in rel:
-                target = rel["target"]
-                if target not in container_ids:
-                    warnings.append(f"Container {container_id}: Relation target not found: {target}")
+    Returns a stand-in for the document holding only its metadata, the
+    containers as a lazy iterator, and every container ID (that pass also
+    parses the whole file, so malformed JSON is reported before validation).
+    """
+    data = {}
+    for metadata in stream_items(filepath, 'metadata'):
+        data["metadata"] = metadata
+        break
 
-            # Validate description length
-            if "description" in rel:
-                if len(rel["description"]) < 10:
-                    warnings.append(f"Container {container_id}: Relation has short description")
+    container_ids = set(stream_items(filepath, 'containers.item.id'))
 
-    return len(errors) == 0, errors, warnings
+    # Peek at the first container so an empty array is still reported as such
+    missing = object()
+    containers = stream_items(filepath, 'containers.item')
+    first = next(containers, missing)
+    if first is missing:
+        return data, [], container_ids
+    return data, chain((first,), containers), container_ids
 
 
 def main() -> int:
@@ -316,10 +432,15 @@ def main() -> int:
     all_valid = True
     for filepath in c2_files:
         print(f"[VALIDATE-C2] Validating {filepath}...", file=sys.stderr)
+        containers = container_ids = None
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            # Very large inputs are parsed incrementally when ijson is installed
+            if ijson is not None and os.path.getsize(filepath) >= STREAM_THRESHOLD_BYTES:
+                data, containers, container_ids = stream_file(filepath)
+            else:
+                with open(filepath, 'rb') as f:
+                    data = json_loads(f.read())
+        except JSON_ERRORS as e:
             error(f"Invalid JSON in {filepath}", actual=str(e))
             return 2
         except Exception as e:
@@ -327,7 +448,7 @@ def main() -> int:
             return 2
 
         # Validate this file
-        result = validate_file(data, filepath)
+        result = validate_file(data, filepath, containers, container_ids)
         if result != 0:
             all_valid = False
             if result == 2:
@@ -336,8 +457,13 @@ def main() -> int:
     return 0 if all_valid else 1
 
 
-def validate_file(data, filepath: str) -> int:
-    """Validate a single c2-containers.json file."""
+def validate_file(
+    data,
+    filepath: str,
+    containers: Optional[Iterable[Dict[str, Any]]] = None,
+    container_ids: Optional[Set[str]] = None,
+) -> int:
+    """Validate a single c2-containers.json file (containers are read from data unless streamed)."""
     has_errors = False
     has_warnings = False
 
@@ -357,60 +483,41 @@ def validate_file(data, filepath: str) -> int:
                 error(err)
         return 2
 
-    # Load c1-systems.json to get system IDs
-    c1_system_ids = set()
+    # Get system IDs from c1-systems.json (already loaded and cached above)
+    c1_system_ids: FrozenSet[str] = frozenset()
     try:
-        with open(c1_file_path, 'r') as f:
-            c1_data = json.load(f)
-            c1_system_ids = {sys.get("id") for sys in c1_data.get("systems", []) if isinstance(sys, dict) and "id" in sys}
+        c1_data = load_parent(c1_file_path)
+        c1_system_ids = frozenset(sys.get("id") for sys in c1_data.get("systems", []) if isinstance(sys, dict) and "id" in sys)
     except (OSError, json.JSONDecodeError):
         # Silent failure is acceptable here - we already validated parent file exists above
         # If we can't load it, validation will fail later when checking container references
         pass
 
-    # 2. Validate containers
-    containers = data.get("containers", [])
-    valid, errors, warns = validate_containers(containers, c1_system_ids)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="containers")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 3. Validate observations
-    valid, errors, warns = validate_observations(containers)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="observations")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 4. Validate relations
-    valid, errors, warns = validate_relations(containers)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="relations")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # Check for systems with no containers (warning)
-    containers_by_system = {}
-    for container in containers:
-        if isinstance(container, dict):
-            system_id = container.get("system_id")
-            if system_id:
-                containers_by_system.setdefault(system_id, []).append(container.get("id"))
-
-    for sys_id in c1_system_ids:
-        if sys_id not in containers_by_system:
+    # 2.-4. Validate containers, observations and relations (one pass)
+    if containers is None:
+        containers = data.get("containers", [])
+    sections, systems_with_containers = validate_all(containers, c1_system_ids, container_ids)
+    for location, (errors, warns) in sections.items():
+        if errors:
+            has_errors = True
+            for err in errors:
+                error(err, location=location)
+        for warn in warns:
             has_warnings = True
-            warning(f"System '{sys_id}' has no containers")
+            warning(warn)
+
+    if systems_with_containers is None:
+        # Unchecked containers may cover any system, so skip that warning too
+        # The limit is checked between containers, so the count can exceed it
+        error_count = sum(len(errors) for errors, _ in sections.values())
+        print(f"[VALIDATE-C2] Stopped after {error_count} errors (limit MELLY_MAX_ERRORS={MAX_ERRORS}) - "
+              "remaining containers were not checked", file=sys.stderr)
+    else:
+        # Check for systems with no containers (warning)
+        for sys_id in c1_system_ids:
+            if sys_id not in systems_with_containers:
+                has_warnings = True
+                warning(f"System '{sys_id}' has no containers")
 
     # Return appropriate exit code
     if has_errors:
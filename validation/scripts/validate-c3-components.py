@@ -14,58 +14,95 @@ import os
 import re
 import glob
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Set
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Any, Set
 
+try:
+    # orjson is an optional, much faster drop-in for decoding the input files
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-# ID pattern
-ID_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+try:
+    # ijson is optional; with it, very large inputs are validated component by
+    # component instead of being loaded whole
+    import ijson
+except ImportError:
+    ijson = None
+
+# Inputs at least this large are streamed when ijson is available
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Exceptions raised for malformed input, by either the loader or the streamer
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+
+# ID pattern (always applied with fullmatch, so no anchors are needed)
+ID_PATTERN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+match_id = ID_PATTERN.fullmatch
+
+# Allowed values are frozensets for O(1) lookups. Membership tests check for
+# str first: JSON lists/objects are unhashable and simply count as unknown.
 
 # Allowed component types
-ALLOWED_COMPONENT_TYPES = [
+ALLOWED_COMPONENT_TYPES = frozenset({
     "service", "controller", "repository", "model", "utility",
     "middleware", "view", "component", "config", "facade",
     "factory", "adapter"
-]
+})
 
 # Observation categories
-OBSERVATION_CATEGORIES = [
+OBSERVATION_CATEGORIES = frozenset({
     "design-patterns", "code-quality", "dependencies", "testing",
     "complexity", "maintainability", "code-structure", "error-handling",
     "performance", "security", "documentation", "coupling", "cohesion"
-]
+})
 
-OBSERVATION_SEVERITIES = ["info", "warning", "critical"]
+OBSERVATION_SEVERITIES = frozenset({"info", "warning", "critical"})
 
 # Relation types
-RELATION_TYPES = [
+RELATION_TYPES = frozenset({
     "dependency", "interface-implementation", "event-publisher", "event-subscriber",
     "uses", "calls", "imports", "injects", "observes", "delegates",
     "provides", "consumes", "inherits", "implements", "composes",
     "aggregates", "notifies", "extends"
-]
+})
 
 # Coupling types
-COUPLING_TYPES = ["loose", "tight"]
+COUPLING_TYPES = frozenset({"loose", "tight"})
+
+# Required fields, in the order missing ones are reported
+COMPONENT_REQUIRED_FIELDS = ("id", "name", "type", "container_id", "responsibility", "structure")
+OBSERVATION_REQUIRED_FIELDS = ("id", "category", "description")
+RELATION_REQUIRED_FIELDS = ("target", "type", "coupling", "description")
 
 
 def error(message: str, location: str = "", expected: str = "", actual: str = "") -> None:
-    """Print formatted error message to stderr."""
-    print(f"[VALIDATE-C3] ERROR: {message}", file=sys.stderr)
+    """Print formatted error message to stderr (in a single write)."""
+    lines = [f"[VALIDATE-C3] ERROR: {message}\n"]
     if location:
-        print(f"  Location: {location}", file=sys.stderr)
+        lines.append(f"  Location: {location}\n")
     if expected:
-        print(f"  Expected: {expected}", file=sys.stderr)
+        lines.append(f"  Expected: {expected}\n")
     if actual:
-        print(f"  Actual: {actual}", file=sys.stderr)
-    print("", file=sys.stderr)
+        lines.append(f"  Actual: {actual}\n")
+    lines.append("\n")
+    sys.stderr.write("".join(lines))
 
 
 def warning(message: str, recommendation: str = "") -> None:
-    """Print formatted warning message to stderr."""
-    print(f"[VALIDATE-C3] WARNING: {message}", file=sys.stderr)
+    """Print formatted warning message to stderr (in a single write)."""
     if recommendation:
-        print(f"  Recommendation: {recommendation}", file=sys.stderr)
-    print("", file=sys.stderr)
+        sys.stderr.write(f"[VALIDATE-C3] WARNING: {message}\n  Recommendation: {recommendation}\n\n")
+    else:
+        sys.stderr.write(f"[VALIDATE-C3] WARNING: {message}\n\n")
+
+
+@lru_cache(maxsize=None)
+def format_container_ids(container_ids: FrozenSet[str]) -> str:
+    """Sorted, comma-separated container IDs, built once however many components miss a container."""
+    return ', '.join(sorted(container_ids))
 
 
 def validate_parent_reference(data: Dict[str, Any], c2_file_path: str) -> Tuple[bool, List[str]]:
@@ -80,8 +117,8 @@ def validate_parent_reference(data: Dict[str, Any], c2_file_path: str) -> Tuple[
 
     # Load parent file
     try:
-        with open(c2_file_path, 'r') as f:
-            c2_data = json.load(f)
+        with open(c2_file_path, 'rb') as f:
+            c2_data = json_loads(f.read())
     except Exception as e:
         errors.append(f"Failed to read parent file: {str(e)}")
         return False, errors
@@ -117,188 +154,255 @@ def validate_parent_reference(data: Dict[str, Any], c2_file_path: str) -> Tuple[
     return True, errors
 
 
-def validate_components(components: List[Dict[str, Any]], c2_container_ids: Set[str]) -> Tuple[bool, List[str], List[str]]:
-    """Validate components array."""
-    errors = []
-    warnings = []
-    seen_ids = set()
-
-    if not components:
-        errors.append("No components found (components array is empty)")
-        return False, errors, warnings
-
-    for idx, component in enumerate(components):
-        if not isinstance(component, dict):
-            errors.append(f"Component at index {idx} is not an object")
+def validate_component(
+    idx: int,
+    component: Dict[str, Any],
+    c2_container_ids: FrozenSet[str],
+    seen_ids: Set[str],
+    errors: List[str],
+    warnings: List[str],
+) -> None:
+    """Validate one component's own fields."""
+    # How messages below refer to this component
+    cid = component.get("id", idx)
+
+    # Validate required fields
+    for field in COMPONENT_REQUIRED_FIELDS:
+        if field not in component:
+            errors.append(f"Component at index {idx}: Missing required field '{field}'")
+
+    # Validate ID
+    if "id" in component:
+        component_id = component["id"]
+
+        # Check ID pattern
+        if not match_id(component_id):
+            errors.append(f"Invalid component ID format: {component_id}")
+
+        # Check for duplicates
+        if component_id in seen_ids:
+            errors.append(f"Duplicate component ID: {component_id}")
+        seen_ids.add(component_id)
+
+    # Validate type
+    if "type" in component:
+        component_type = component["type"]
+        if not isinstance(component_type, str) or component_type not in ALLOWED_COMPONENT_TYPES:
+            warnings.append(f"Unknown component type: {component['type']} (component: {component.get('id', 'unknown')})")
+
+    # Validate container_id (must reference valid C2 container)
+    if "container_id" in component:
+        container_id = component["container_id"]
+        if container_id not in c2_container_ids:
+            errors.append(f"Component {cid}: Container not found: {container_id}")
+            errors.append(f"  Available containers: {format_container_ids(c2_container_ids)}")
+
+    # Validate structure
+    if "structure" in component:
+        struct = component["structure"]
+        if not isinstance(struct, dict):
+            errors.append(f"Component {cid}: 'structure' must be an object")
+        else:
+            if "path" not in struct:
+                errors.append(f"Component {cid}: Missing 'structure.path'")
+            if "language" not in struct:
+                errors.append(f"Component {cid}: Missing 'structure.language'")
+
+            # Check for empty files array (warning)
+            if "files" in struct and isinstance(struct["files"], list) and len(struct["files"]) == 0:
+                warnings.append(f"Component {cid}: Empty 'files' array")
+
+
+def validate_observations(component_id: Any, observations: Any, errors: List[str], warnings: List[str]) -> None:
+    """Validate the observations of one component."""
+    if not isinstance(observations, list):
+        errors.append(f"Component {component_id}: 'observations' must be an array")
+        return
+
+    seen_obs_ids = set()
+
+    for idx, obs in enumerate(observations):
+        if not isinstance(obs, dict):
+            errors.append(f"Component {component_id}: Observation at index {idx} is not an object")
             continue
 
         # Validate required fields
-        required_fields = ["id", "name", "type", "container_id", "responsibility", "structure"]
-        for field in required_fields:
-            if field not in component:
-                errors.append(f"Component at index {idx}: Missing required field '{field}'")
-
-        # Validate ID
-        if "id" in component:
-            component_id = component["id"]
+        for field in OBSERVATION_REQUIRED_FIELDS:
+            if field not in obs:
+                errors.append(f"Component {component_id}: Observation at index {idx} missing '{field}'")
+
+        # Validate ID uniqueness
+        if "id" in obs:
+            obs_id = obs["id"]
+            if obs_id in seen_obs_ids:
+                errors.append(f"Component {component_id}: Duplicate observation ID: {obs_id}")
+            seen_obs_ids.add(obs_id)
+
+        # Validate category
+        if "category" in obs:
+            category = obs["category"]
+            if not isinstance(category, str) or category not in OBSERVATION_CATEGORIES:
+                warnings.append(f"Component {component_id}: Unknown observation category: {obs['category']}")
+
+        # Validate severity
+        if "severity" in obs:
+            severity = obs["severity"]
+            if not isinstance(severity, str) or severity not in OBSERVATION_SEVERITIES:
+                errors.append(f"Component {component_id}: Invalid severity: {obs['severity']}")
+
+        # Validate description length
+        if "description" in obs:
+            if len(obs["description"]) < 10:
+                warnings.append(f"Component {component_id}: Observation '{obs.get('id', idx)}' has short description")
+
+
+def validate_relations(
+    component_id: Any,
+    relations: Any,
+    component_ids: Set[str],
+    errors: List[str],
+    warnings: List[str],
+) -> Tuple[int, int]:
+    """
+    Validate the relations of one component (component_ids: every component ID in the file).
+
+    Returns how many relations were checked and how many of them are tightly
+    coupled, for the file-wide coupling analysis.
+    """
+    total = 0
+    tight = 0
+
+    if not isinstance(relations, list):
+        errors.append(f"Component {component_id}: 'relations' must be an array")
+        return total, tight
+
+    for idx, rel in enumerate(relations):
+        if not isinstance(rel, dict):
+            errors.append(f"Component {component_id}: Relation at index {idx} is not an object")
+            continue
 
-            # Check ID pattern
-            if not ID_PATTERN.match(component_id):
-                errors.append(f"Invalid component ID format: {component_id}")
+        total += 1
 
-            # Check for duplicates
-            if component_id in seen_ids:
-                errors.append(f"Duplicate component ID: {component_id}")
-            seen_ids.add(component_id)
+        # Validate required fields
+        for field in RELATION_REQUIRED_FIELDS:
+            if field not in rel:
+                errors.append(f"Component {component_id}: Relation at index {idx} missing '{field}'")
 
         # Validate type
-        if "type" in component:
-            if component["type"] not in ALLOWED_COMPONENT_TYPES:
-                warnings.append(f"Unknown component type: {component['type']} (component: {component.get('id', 'unknown')})")
-
-        # Validate container_id (must reference valid C2 container)
-        if "container_id" in component:
-            container_id = component["container_id"]
-            if container_id not in c2_container_ids:
-                errors.append(f"Component {component.get('id', idx)}: Container not found: {container_id}")
-                errors.append(f"  Available containers: {', '.join(sorted(c2_container_ids))}")
-
-        # Validate structure
-        if "structure" in component:
-            struct = component["structure"]
-            if not isinstance(struct, dict):
-                errors.append(f"Component {component.get('id', idx)}: 'structure' must be an object")
-            else:
-                if "path" not in struct:
-                    errors.append(f"Component {component.get('id', idx)}: Missing 'structure.path'")
-                if "language" not in struct:
-                    errors.append(f"Component {component.get('id', idx)}: Missing 'structure.language'")
+        if "type" in rel:
+            rel_type = rel["type"]
+            if not isinstance(rel_type, str) or rel_type not in RELATION_TYPES:
+                warnings.append(f"Component {component_id}: Unknown relation type: {rel['type']}")
+
+        # Validate coupling
+        if "coupling" in rel:
+            coupling = rel["coupling"]
+            if not isinstance(coupling, str) or coupling not in COUPLING_TYPES:
+                errors.append(f"Component {component_id}: Invalid coupling: {rel['coupling']} (must be 'loose' or 'tight')")
+            elif coupling == "tight":
+                tight += 1
+
+        # Validate target
+        if "target" in rel:
+            target = rel["target"]
+            if target not in component_ids:
+                warnings.append(f"Component {component_id}: Relation target not found: {target}")
+
+        # Validate description length
+        if "description" in rel:
+            if len(rel["description"]) < 10:
+                warnings.append(f"Component {component_id}: Relation has short description")
+
+    return total, tight
+
+
+def validate_all(
+    components: Iterable[Dict[str, Any]],
+    c2_container_ids: FrozenSet[str],
+    component_ids: Optional[Set[str]] = None,
+) -> Tuple[Dict[str, Tuple[List[str], List[str]]], Set[str]]:
+    """
+    Validate components, observations and relations in a single pass over components.
+
+    Returns (errors, warnings) per section - "components", "observations" and
+    "relations", in that order - plus the IDs of the containers that have at
+    least one component. component_ids is collected from components unless
+    given.
+    """
+    sections = {"components": ([], []), "observations": ([], []), "relations": ([], [])}
+    comp_errors, comp_warnings = sections["components"]
+    obs_errors, obs_warnings = sections["observations"]
+    rel_errors, rel_warnings = sections["relations"]
+    used_containers: Set[str] = set()
 
-                # Check for empty files array (warning)
-                if "files" in struct and isinstance(struct["files"], list) and len(struct["files"]) == 0:
-                    warnings.append(f"Component {component.get('id', idx)}: Empty 'files' array")
-
-    return len(errors) == 0, errors, warnings
+    if not components:
+        comp_errors.append("No components found (components array is empty)")
+        return sections, used_containers
 
+    # Relations may point at components defined later, so every ID is
+    # collected up front
+    if component_ids is None:
+        component_ids = {c.get("id") for c in components if isinstance(c, dict) and "id" in c}
+    seen_ids: Set[str] = set()
 
-def validate_observations(components: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate observations in all components."""
-    errors = []
-    warnings = []
+    # Track tight coupling and total relations
+    tight_coupling_count = 0
+    total_relations = 0
 
-    for component in components:
+    for idx, component in enumerate(components):
         if not isinstance(component, dict):
+            comp_errors.append(f"Component at index {idx} is not an object")
             continue
 
-        component_id = component.get("id", "unknown")
-        observations = component.get("observations", [])
-
-        if not isinstance(observations, list):
-            errors.append(f"Component {component_id}: 'observations' must be an array")
-            continue
-
-        seen_obs_ids = set()
+        validate_component(idx, component, c2_container_ids, seen_ids, comp_errors, comp_warnings)
 
-        for idx, obs in enumerate(observations):
-            if not isinstance(obs, dict):
-                errors.append(f"Component {component_id}: Observation at index {idx} is not an object")
-                continue
-
-            # Validate required fields
-            required_fields = ["id", "category", "description"]
-            for field in required_fields:
-                if field not in obs:
-                    errors.append(f"Component {component_id}: Observation at index {idx} missing '{field}'")
-
-            # Validate ID uniqueness
-            if "id" in obs:
-                obs_id = obs["id"]
-                if obs_id in seen_obs_ids:
-                    errors.append(f"Component {component_id}: Duplicate observation ID: {obs_id}")
-                seen_obs_ids.add(obs_id)
-
-            # Validate category
-            if "category" in obs:
-                if obs["category"] not in OBSERVATION_CATEGORIES:
-                    warnings.append(f"Component {component_id}: Unknown observation category: {obs['category']}")
-
-            # Validate severity
-            if "severity" in obs:
-                if obs["severity"] not in OBSERVATION_SEVERITIES:
-                    errors.append(f"Component {component_id}: Invalid severity: {obs['severity']}")
-
-            # Validate description length
-            if "description" in obs:
-                if len(obs["description"]) < 10:
-                    warnings.append(f"Component {component_id}: Observation '{obs.get('id', idx)}' has short description")
-
-    return len(errors) == 0, errors, warnings
+        component_id = component.get("id", "unknown")
+        validate_observations(component_id, component.get("observations", []), obs_errors, obs_warnings)
+        total, tight = validate_relations(
+            component_id, component.get("relations", []), component_ids, rel_errors, rel_warnings
+        )
+        total_relations += total
+        tight_coupling_count += tight
 
+        container_id = component.get("container_id")
+        if container_id:
+            used_containers.add(container_id)
 
-def validate_relations(components: List[Dict[str, Any]]) -> Tuple[bool, List[str], List[str]]:
-    """Validate relations and coupling analysis."""
-    errors = []
-    warnings = []
+    # Warn about high tight coupling (based on total relations, not component count)
+    if total_relations > 0 and tight_coupling_count > total_relations * 0.3:  # > 30% tight coupling
+        rel_warnings.append(f"High tight coupling detected: {tight_coupling_count}/{total_relations} relations are tightly coupled (code smell)")
 
-    # Collect all component IDs
-    component_ids = {c.get("id") for c in components if isinstance(c, dict) and "id" in c}
+    return sections, used_containers
 
-    # Track tight coupling and total relations
-    tight_coupling_count = 0
-    total_relations = 0
 
-    for component in components:
-        if not isinstance(component, dict):
-            continue
+def stream_items(filepath: str, prefix: str) -> Iterator[Any]:
+    """Yield the values at prefix in filepath as ijson parses them."""
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
 
-        component_id = component.get("id", "unknown")
-        relations = component.get("relations", [])
 
-        if not isinstance(relations, list):
-            errors.append(f"Component {component_id}: 'relations' must be an array")
-            continue
+def stream_file(filepath: str) -> Tuple[Dict[str, Any], Iterable[Dict[str, Any]], Set[str]]:
+    """
+    Read a large c3-components.json without loading it whole.
 
-        for idx, rel in enumerate(relations):
-            if not isinstance(rel, dict):
-                errors.append(f"Component {component_id}: Relation at index {idx} is not an object")
-                continue
-
-            total_relations += 1
-
-            # Validate required fields
-            required_fields = ["target", "type", "coupling", "description"]
-            for field in required_fields:
-                if field not in rel:
-                    errors.append(f"Component {component_id}: Relation at index {idx} missing '{field}'")
-
-            # Validate type
-            if "type" in rel:
-                if rel["type"] not in RELATION_TYPES:
-                    warnings.append(f"Component {component_id}: Unknown relation type: {rel['type']}")
-
-            # Validate coupling
-            if "coupling" in rel:
-                if rel["coupling"] not in COUPLING_TYPES:
-                    errors.append(f"Component {component_id}: Invalid coupling: {rel['coupling']} (must be 'loose' or 'tight')")
-                elif rel["coupling"] == "tight":
-                    tight_coupling_count += 1
-
-            # Validate target
-            if "target" in rel:
-                target = rel["target"]
-                if target not in component_ids:
-                    warnings.append(f"Component {component_id}: Relation target not found: {target}")
-
-            # Validate description length
-            if "description" in rel:
-                if len(rel["description"]) < 10:
-                    warnings.append(f"Component {component_id}: Relation has short description")
+    Returns a stand-in for the document holding only its metadata, the
+    components as a lazy iterator, and every component ID (that pass also
+    parses the whole file, so malformed JSON is reported before validation).
+    """
+    data = {}
+    for metadata in stream_items(filepath, 'metadata'):
+        data["metadata"] = metadata
+        break
 
-    # Warn about high tight coupling (based on total relations, not component count)
-    if total_relations > 0 and tight_coupling_count > total_relations * 0.3:  # > 30% tight coupling
-        warnings.append(f"High tight coupling detected: {tight_coupling_count}/{total_relations} relations are tightly coupled (code smell)")
+    component_ids = set(stream_items(filepath, 'components.item.id'))
 
-    return len(errors) == 0, errors, warnings
+    # Peek at the first component so an empty array is still reported as such
+    missing = object()
+    components = stream_items(filepath, 'components.item')
+    first = next(components, missing)
+    if first is missing:
+        return data, [], component_ids
+    return data, chain((first,), components), component_ids
 
 
 def main() -> int:
@@ -315,10 +419,15 @@ def main() -> int:
     all_valid = True
     for filepath in c3_files:
         print(f"[VALIDATE-C3] Validating {filepath}...", file=sys.stderr)
+        components = component_ids = None
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            # Very large inputs are parsed incrementally when ijson is installed
+            if ijson is not None and os.path.getsize(filepath) >= STREAM_THRESHOLD_BYTES:
+                data, components, component_ids = stream_file(filepath)
+            else:
+                with open(filepath, 'rb') as f:
+                    data = json_loads(f.read())
+        except JSON_ERRORS as e:
             error(f"Invalid JSON in {filepath}", actual=str(e))
             return 2
         except Exception as e:
@@ -326,7 +435,7 @@ def main() -> int:
             return 2
 
         # Validate this file
-        result = validate_file(data, filepath)
+        result = validate_file(data, filepath, components, component_ids)
         if result != 0:
             all_valid = False
             if result == 2:
@@ -335,8 +444,13 @@ def main() -> int:
     return 0 if all_valid else 1
 
 
-def validate_file(data, filepath: str) -> int:
-    """Validate a single c3-components.json file."""
+def validate_file(
+    data,
+    filepath: str,
+    components: Optional[Iterable[Dict[str, Any]]] = None,
+    component_ids: Optional[Set[str]] = None,
+) -> int:
+    """Validate a single c3-components.json file (components are read from data unless streamed)."""
     has_errors = False
     has_warnings = False
 
@@ -356,57 +470,32 @@ def validate_file(data, filepath: str) -> int:
         return 2
 
     # Load c2-containers.json to get container IDs
-    c2_container_ids = set()
+    c2_container_ids = frozenset()
     try:
-        with open(c2_file_path, 'r') as f:
-            c2_data = json.load(f)
-            c2_container_ids = {c.get("id") for c in c2_data.get("containers", []) if isinstance(c, dict) and "id" in c}
+        with open(c2_file_path, 'rb') as f:
+            c2_data = json_loads(f.read())
+            c2_container_ids = frozenset(c.get("id") for c in c2_data.get("containers", []) if isinstance(c, dict) and "id" in c)
     except (OSError, json.JSONDecodeError):
         # Silent failure is acceptable here - we already validated parent file exists above
         # If we can't load it, validation will fail later when checking component references
         pass
 
-    # 2. Validate components
-    components = data.get("components", [])
-    valid, errors, warns = validate_components(components, c2_container_ids)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="components")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 3. Validate observations
-    valid, errors, warns = validate_observations(components)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="observations")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
-
-    # 4. Validate relations
-    valid, errors, warns = validate_relations(components)
-    if not valid:
-        has_errors = True
-        for err in errors:
-            error(err, location="relations")
-    for warn in warns:
-        has_warnings = True
-        warning(warn)
+    # 2.-4. Validate components, observations and relations (one pass)
+    if components is None:
+        components = data.get("components", [])
+    sections, used_containers = validate_all(components, c2_container_ids, component_ids)
+    for location, (errors, warns) in sections.items():
+        if errors:
+            has_errors = True
+            for err in errors:
+                error(err, location=location)
+        for warn in warns:
+            has_warnings = True
+            warning(warn)
 
     # Check for containers with no components (warning)
-    components_by_container = {}
-    for component in components:
-        if isinstance(component, dict):
-            container_id = component.get("container_id")
-            if container_id:
-                components_by_container.setdefault(container_id, []).append(component.get("id"))
-
     for container_id in c2_container_ids:
-        if container_id not in components_by_container:
+        if container_id not in used_containers:
             has_warnings = True
             warning(f"Container '{container_id}' has no components")
 
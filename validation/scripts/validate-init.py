@@ -15,35 +15,47 @@ import re
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Any
 
+try:
+    # orjson is an optional, much faster drop-in for decoding the input files
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-# Allowed manifest types
-ALLOWED_MANIFEST_TYPES = [
+
+# Allowed manifest types (a frozenset for O(1) lookups; non-str values are
+# checked first since JSON lists/objects are unhashable)
+ALLOWED_MANIFEST_TYPES = frozenset({
     "npm", "composer", "cargo", "go-mod", "gradle", "maven",
     "requirements-txt", "pyproject-toml", "gemfile", "unknown"
-]
+})
+
+# Required fields, in the order missing ones are reported
+METADATA_REQUIRED_FIELDS = ("schema_version", "generator", "generated_by", "timestamp", "melly_version")
+MANIFEST_REQUIRED_FIELDS = ("type", "path", "data")
 
 # Semver pattern
 SEMVER_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
 
 
 def error(message: str, location: str = "", expected: str = "", actual: str = "") -> None:
-    """Print formatted error message to stderr."""
-    print(f"[VALIDATE-INIT] ERROR: {message}", file=sys.stderr)
+    """Print formatted error message to stderr (in a single write)."""
+    lines = [f"[VALIDATE-INIT] ERROR: {message}\n"]
     if location:
-        print(f"  Location: {location}", file=sys.stderr)
+        lines.append(f"  Location: {location}\n")
     if expected:
-        print(f"  Expected: {expected}", file=sys.stderr)
+        lines.append(f"  Expected: {expected}\n")
     if actual:
-        print(f"  Actual: {actual}", file=sys.stderr)
-    print("", file=sys.stderr)
+        lines.append(f"  Actual: {actual}\n")
+    lines.append("\n")
+    sys.stderr.write("".join(lines))
 
 
 def warning(message: str, recommendation: str = "") -> None:
-    """Print formatted warning message to stderr."""
-    print(f"[VALIDATE-INIT] WARNING: {message}", file=sys.stderr)
+    """Print formatted warning message to stderr (in a single write)."""
     if recommendation:
-        print(f"  Recommendation: {recommendation}", file=sys.stderr)
-    print("", file=sys.stderr)
+        sys.stderr.write(f"[VALIDATE-INIT] WARNING: {message}\n  Recommendation: {recommendation}\n\n")
+    else:
+        sys.stderr.write(f"[VALIDATE-INIT] WARNING: {message}\n\n")
 
 
 def validate_schema_structure(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -58,8 +70,7 @@ def validate_schema_structure(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     metadata = data["metadata"]
 
     # Check metadata fields
-    required_metadata = ["schema_version", "generator", "generated_by", "timestamp", "melly_version"]
-    for field in required_metadata:
+    for field in METADATA_REQUIRED_FIELDS:
         if field not in metadata:
             errors.append(f"Missing required field: metadata.{field}")
 
@@ -159,14 +170,14 @@ def validate_package_manifests(repositories: List[Dict[str, Any]]) -> Tuple[bool
                 continue
 
             # Check required fields
-            required_fields = ["type", "path", "data"]
-            for field in required_fields:
+            for field in MANIFEST_REQUIRED_FIELDS:
                 if field not in manifest:
                     errors.append(f"Manifest at index {idx}: Missing '{field}' field")
 
             # Validate type
             if "type" in manifest:
-                if manifest["type"] not in ALLOWED_MANIFEST_TYPES:
+                manifest_type = manifest["type"]
+                if not isinstance(manifest_type, str) or manifest_type not in ALLOWED_MANIFEST_TYPES:
                     warnings.append(f"Unknown manifest type: {manifest['type']}")
 
             # Validate path (should be relative)
@@ -250,8 +261,8 @@ def main() -> int:
 
     # Load and validate the init.json file
     try:
-        with open(init_file, 'r') as f:
-            data = json.load(f)
+        with open(init_file, 'rb') as f:
+            data = json_loads(f.read())
     except json.JSONDecodeError as e:
         error(f"Invalid JSON in {init_file}", actual=str(e))
         return 2
@@ -0,0 +1,28 @@
+"""Shared helpers for the validation script tests."""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# The generators import their shared helpers (_c_common) from the scripts directory
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def load_script(filename: str):
+    """Import one of the (hyphen-named) validation scripts as a module."""
+    name = filename[:-len(".py")].replace("-", "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def c1():
+    return load_script("validate-c1-systems.py")
@@ -0,0 +1,48 @@
+"""Tests for generate-c-markdown.py."""
+import argparse
+import json
+import sys
+
+import pytest
+
+from conftest import load_script
+
+SYSTEMS = {"systems": [{"id": "web", "name": "Web"}, {"id": "api", "name": "API"}]}
+COMPONENTS = [
+    {"id": "auth", "container_id": "api-server", "name": "Auth"},
+    {"id": "billing", "container_id": "api-server", "name": "Billing"},
+    {"id": "users", "container_id": "api-server", "name": "Users"},
+    {"name": "No ID, skipped"},
+]
+
+
+def test_totals_include_streamed_levels(tmp_path, monkeypatch, capsys):
+    gen = load_script("generate-c-markdown.py")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "c1.json").write_text(json.dumps(SYSTEMS))
+    (tmp_path / "c3.json").write_text(json.dumps({"components": COMPONENTS}))
+
+    # Stream the c3 input as if it were above the size threshold
+    def stream_items(json_file, key):
+        return iter(COMPONENTS) if key == "components" else None
+
+    monkeypatch.setattr(gen, "stream_items", stream_items)
+    monkeypatch.setattr(sys, "argv", [
+        "generate-c-markdown.py", "--input", "c1=c1.json", "--input", "c3=c3.json",
+    ])
+    gen.main()
+
+    assert capsys.readouterr().out.rstrip().endswith("Done! Generated 5 markdown file(s), 0 unchanged")
+    assert len(list((tmp_path / "knowledge-base" / "systems").rglob("*.md"))) == 5
+
+    # A second run finds every file up to date
+    gen.main()
+    assert capsys.readouterr().out.rstrip().endswith("Done! Generated 0 markdown file(s), 5 unchanged")
+
+
+def test_level_input_pairs_level_and_file():
+    gen = load_script("generate-c-markdown.py")
+    assert gen.level_input("c2=out/c2=x.json") == ("c2", "out/c2=x.json")
+    for bad in ("c2.json", "c9=c9.json", "c1="):
+        with pytest.raises(argparse.ArgumentTypeError):
+            gen.level_input(bad)
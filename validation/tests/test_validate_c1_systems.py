@@ -0,0 +1,42 @@
+"""Tests for validate-c1-systems.py."""
+import json
+import subprocess
+import sys
+
+from conftest import SCRIPTS_DIR
+
+INIT = {"metadata": {"timestamp": "2025-01-01T00:00:00Z"}, "repositories": [{"name": "web", "path": "/srv/web"}]}
+GOOD = {
+    "metadata": {"timestamp": "2025-01-02T00:00:00Z", "parent": {"timestamp": "2025-01-01T00:00:00Z"}},
+    "systems": [{
+        "id": "web", "name": "Web", "type": "web-application", "repositories": ["web"],
+        "description": "The public web application", "observations": [], "relations": [],
+    }],
+}
+
+
+def test_find_cycles_self_loop_does_not_hide_cycle(c1):
+    graph = {"web": ["web", "api"], "api": ["web"]}
+    assert c1.find_cycles(graph) == [["web", "api", "web"]]
+
+
+def test_find_cycles_lone_self_loop(c1):
+    graph = {"web": ["web"], "api": []}
+    assert c1.find_cycles(graph) == [["web", "web"]]
+
+
+def test_daemon_survives_malformed_documents(tmp_path):
+    (tmp_path / "knowledge-base").mkdir()
+    (tmp_path / "knowledge-base" / "init.json").write_text(json.dumps(INIT))
+    bad = json.dumps({"metadata": {}, "systems": [{"id": 5}]})
+    stdin = f"{bad}\n".encode() + b"\xff\n" + f"{json.dumps(GOOD)}\n".encode()
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "validate-c1-systems.py"), "--daemon"],
+        input=stdin, capture_output=True, cwd=tmp_path, timeout=30,
+    )
+
+    assert proc.returncode == 0
+    # One result per document: a shape error, undecodable bytes, then warnings only
+    assert proc.stdout.decode().split() == ["2", "2", "1"]
+    assert "Failed to validate <stdin:1>" in proc.stderr.decode()
@@ -0,0 +1,43 @@
+"""Tests for validate-c2-containers.py."""
+import json
+import os
+import subprocess
+import sys
+
+from conftest import SCRIPTS_DIR
+
+C1 = {"metadata": {"timestamp": "2025-01-01T00:00:00Z"}, "systems": [{"id": "s"}]}
+# Every container misses the same five required fields
+C2 = {
+    "metadata": {"timestamp": "2025-01-02T00:00:00Z"},
+    "containers": [{"id": f"c{i}", "system_id": "s"} for i in range(10)],
+}
+
+
+def run_validator(tmp_path, **env):
+    kb = tmp_path / "knowledge-base"
+    (kb / "systems" / "s").mkdir(parents=True)
+    (kb / "c1-systems.json").write_text(json.dumps(C1))
+    (kb / "systems" / "s" / "c2-containers.json").write_text(json.dumps(C2))
+    return subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "validate-c2-containers.py")],
+        capture_output=True, text=True, cwd=tmp_path, timeout=30,
+        env={**os.environ, **env},
+    )
+
+
+def test_max_errors_stops_after_the_container_reaching_the_limit(tmp_path):
+    proc = run_validator(tmp_path, MELLY_MAX_ERRORS="1")
+
+    assert proc.returncode == 2
+    assert proc.stderr.count("ERROR:") == 5
+    assert "Container at index 1" not in proc.stderr
+    assert "Stopped after 5 errors (limit MELLY_MAX_ERRORS=1)" in proc.stderr
+
+
+def test_max_errors_unset_reports_everything(tmp_path):
+    proc = run_validator(tmp_path, MELLY_MAX_ERRORS="")
+
+    assert proc.returncode == 2
+    assert proc.stderr.count("ERROR:") == 50
+    assert "Stopped after" not in proc.stderr